@@ -0,0 +1,57 @@
+#=================================================\\Documentation//==================================================
+
+"""
+OptiNumPy - Numerical Analysis Optimization Package.
+
+The public API is exposed here but each submodule is only imported the first time one of its names is used,
+so that ``import OptiNumPy`` stays cheap (see benchmarks/import_time.py for the import-time budget).
+
+"""
+
+#================================================\\Libraries needed//================================================
+
+import importlib
+
+#====================================================\\Public API//==================================================
+
+_API = {
+    'univariate_optimization' : (
+        'fixed_step_size' , 'accelerated_step_size' , 'Exhaustive_search' , 'Dichotomous_search' ,
+        'Interval_Halving_Method' , 'Fibonacci_method' , 'Golden_section' , 'Fibonacci_method_batch' ,
+        'Golden_section_batch' , 'Newton_method' , 'Quasi_Newton' , 'Secant_method' , 'CacheEvaluations' ,
+    ) ,
+    'multivariate_optimization' : (
+        'methode_gradient' , 'gradient_conjugue' , 'gradient_conjugue_non_lineaire' , 'methode_Newton' ,
+        'Newton_CG' , 'Quasi_Newton_and_armijo' , 'Derivees' , 'SGD' , 'AdaGrad' , 'RMSProp' , 'Adam' ,
+        'calendrier_exponentiel' , 'calendrier_inverse' , 'calendrier_cosinus' ,
+    ) ,
+    'equation_solving' : (
+        'Gauss_Jordan_to_Solvea_system' , 'inverse' , 'FactorisationLU' , 'Decomposition_LU_PA' ,
+        'Dec_PA_LU_to_Solvea_system' , 'CacheFactorisations' , 'Dec_Choleski' , 'Choleski_to_Solvea_system' ,
+        'Thomas' , 'LU_bande_to_Solvea_system' , 'Choleski_bande_to_Solvea_system' , 'Creux_to_Solvea_system' ,
+        'Gradient_conjugue_to_Solvea_system' , 'GMRES_to_Solvea_system' , 'BiCGSTAB_to_Solvea_system' ,
+    ) ,
+    'triangular_solving' : ( 'resoudre_triangulaire' , 'TriangulaireCreuse' ) ,
+    'sparse_matrix' : ( 'MatriceCSR' , 'Cuthill_McKee_inverse' ) ,
+    'finite_differences' : ( 'DifferencesFinies' , ) ,
+    'global_search' : ( 'multi_depart' , 'ResultatMultiDepart' ) ,
+    'optimization_result' : ( 'ResultatOptimisation' , 'Historique' ) ,
+}
+
+_MODULE_DE = { nom : module for module , noms in _API.items() for nom in noms }
+
+__all__ = sorted( _MODULE_DE ) + sorted( _API )
+
+def __getattr__( nom ) :
+    if nom in _API :
+        return importlib.import_module( '.' + nom , __name__ )
+    if nom in _MODULE_DE :
+        valeur = getattr( importlib.import_module( '.' + _MODULE_DE[ nom ] , __name__ ) , nom )
+        globals()[ nom ] = valeur
+        return valeur
+    raise AttributeError( "module %r has no attribute %r" % ( __name__ , nom ) )
+
+def __dir__( ) :
+    return sorted( set( globals() ) | set( __all__ ) )
+
+#====================================================================================================================
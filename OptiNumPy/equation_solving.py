@@ -9,14 +9,81 @@ such as Gauss-Jordan, LU decomposition and Cholesky decomposition.
 #================================================\\Libraries needed//================================================
 
 import numpy as np
-import numdifftools as nd
 import math as m
+import hashlib
+import warnings
+from collections import OrderedDict
+from .triangular_solving import resoudre_triangulaire , TriangulaireCreuse
+from .sparse_matrix import MatriceCSR , en_CSR , est_creuse , Cuthill_McKee_inverse
 
 #=========================================\\The Elimination Of Gauss-Jordan//========================================
 
-# 1.The Inverse of a Matrix:
+# 1.Elimination engine:
+
+def elimination_Gauss_Jordan( A , B , bloc = 64 ) :
+    """
+    Réduire en place le système ``A X = B`` par élimination de Gauss-Jordan par blocs avec pivot partiel.
+
+    Pour chaque panneau de ``bloc`` colonnes, l'élimination est faite ligne par ligne sur les colonnes du
+    panneau seulement, en accumulant la transformation appliquée ; elle est ensuite reportée sur les colonnes
+    restantes de ``A`` et sur ``B`` par un unique produit matriciel.
+
+    Parameters
+    ----------
+    A : (N, N) ndarray
+        Matrice de système, de type flottant. Elle est détruite.
+    B : (N, K) ndarray
+        Côtés droits, de type flottant. Ils sont remplacés par la solution.
+    bloc : int, optional
+        Nombre de colonnes par panneau. The default is 64.
+
+    Returns
+    -------
+    B : (N, K) ndarray
+        Solution au système (le même tableau que l'argument ``B``).
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        Si la matrice est singulière.
+
+    """
+    N = A.shape[ 0 ]
+    for k in range(0,N,bloc):
+        kb = min( bloc , N - k )
+        J = slice( k , k + kb )
+        # G contient les colonnes J de la transformation accumulée sur le panneau.
+        G = np.zeros(( N , kb ) , dtype = A.dtype )
+        for j in range(k,k+kb):
+            c = j - k
+            p = j + np.argmax( abs( A[ j: , j ] ) )
+            if A[ p ][ j ] == 0 :
+                raise np.linalg.LinAlgError( "Matrice singulière" )
+            if p != j :
+                A[ [ j , p ] ] = A[ [ p , j ] ]
+                B[ [ j , p ] ] = B[ [ p , j ] ]
+                G[ [ j , p ] , :c ] = G[ [ p , j ] , :c ]
+            u = A[ : , j ] / A[ j ][ j ]
+            u[ j ] = 1 - 1 / A[ j ][ j ]
+            A[ : , j:k+kb ] -= np.outer( u , A[ j , j:k+kb ] )
+            G[ : , :c ] -= np.outer( u , G[ j , :c ] )
+            G[ : , c ] = -u
+            G[ j ][ c ] += 1
+        G[ J ] -= np.identity( kb , dtype = A.dtype )
+        if k + kb < N :
+            A[ : , k+kb: ] += G @ A[ J , k+kb: ]
+        B += G @ B[ J ]
+    return B
+
+def preparer_systeme( A , B , overwrite_a , overwrite_b ) :
+    dtype = np.result_type( np.asarray( A ).dtype , np.asarray( B ).dtype , float )
+    A = np.asarray( A , dtype = dtype , order = 'C' ) if overwrite_a else np.array( A , dtype = dtype , order = 'C' )
+    B = np.asarray( B , dtype = dtype , order = 'C' ) if overwrite_b else np.array( B , dtype = dtype , order = 'C' )
+    return A , B
+
+# 2.The Inverse of a Matrix:
     
-def inverse( A ):
+def inverse( A , overwrite_a = False , bloc = 64 ):
     """
     Calculer l'inverse d'une matrice carrée.
 
@@ -24,6 +91,10 @@ def inverse( A ):
     ----------
     A : (N, N) array_like
         Matrice a invirse.
+    overwrite_a : bool, optional
+        Autoriser la destruction de ``A`` pour économiser une copie. The default is False.
+    bloc : int, optional
+        Nombre de colonnes par panneau d'élimination. The default is 64.
 
     Returns
     -------
@@ -31,94 +102,177 @@ def inverse( A ):
         L'inverse de A.
 
     """
-    
     N = len( A )
-    I = np.identity( N )
-    A = np.c_[ A , I ]
-    for n in range(0,N):
-        p = A[ n ][ n ]
-        for i in range(n+1,N):
-            x = A[ i ][ n ]
-            for j in range(n,2*N):
-                A[ i ][ j ] = A[ i ][ j ] - x * A[ n ][ j ] / p
-    for n in range(N-1,0,-1):
-        p = A[ n ][ n ]
-        for i in range(n-1,-1,-1):
-            x = A[ i ][ n ]
-            for j in range(n,2*N):
-                A[ i ][ j ] = A[ i ][ j ] - x * A[ n ][ j ]/ p
-    for i in range(0,N):
-        p = A[ i ][ i ]
-        for j in range(i,2*N):
-            A[ i ][ j ] = A[ i ][ j ] / p
-    A_1 = I   
-    for i in range(0,N):
-        for j in range(0,N):
-            A_1[ i ][ j ] = A[ i ][ j+N ]
+    A , I = preparer_systeme( A , np.identity( N ) , overwrite_a , True )
+    A_1 = elimination_Gauss_Jordan( A , I , bloc )
     return A_1
 
 
-# 2.Gauss_Jordan method to solve system of linear equations:
+# 3.Gauss_Jordan method to solve system of linear equations:
 
 
-def Gauss_Jordan_to_Solvea_system( A , b ):
+def Gauss_Jordan_to_Solvea_system( A , b , overwrite_a = False , overwrite_b = False , bloc = 64 ):
     """
     Résoudre un système d'équations, A x = b.
 
     Parameters
     ----------
-    A : (N, N) array_like
-        Matrice de système.
-    b : ( N ) array
-        Côté droit.
+    A : (N, N) array_like, MatriceCSR or scipy.sparse matrix
+        Matrice de système. Une matrice creuse est résolue par ``Creux_to_Solvea_system``.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+    overwrite_a : bool, optional
+        Autoriser la destruction de ``A``. The default is False.
+    overwrite_b : bool, optional
+        Autoriser l'écriture de la solution dans ``b``. The default is False.
+    bloc : int, optional
+        Nombre de colonnes par panneau d'élimination. The default is 64.
 
     Returns
     -------
-    x : ( N ) array
+    x : ( N ) or (N, K) array
         Solution au système.
 
     """
-    A = np.c_[ A , b ]
-    N = len( A )
-    for n in range(0,N):
-        p = A[ n ][ n ]
-        for i in range(n+1,N):
-            x = A[ i ][ n ]
-            for j in range(n,N+1):
-                A[ i ][ j ] = A[ i ][ j ] - x * A[ n ][ j ] / p
-    for n in range(N-1,0,-1):
-        p = A[ n ][ n ]
-        for i in range(n-1,-1,-1):
-            x = A[ i ][ n ]
-            for j in range(n,N+1):
-                A[ i ][ j ] = A[ i ][ j ] - x * A[ n ][ j ] / p
-    for i in range(0,N):
-        p = A[ i ][ i ]
-        for j in range(i,N+1):
-            A[ i ][ j ] = A[ i ][ j ] / p
-    x=np.zeros(N)
-    for i in range(0,N):
-        x[ i ] = A[ i ][ N ]
-    return x
+    if est_creuse( A ) :
+        return Creux_to_Solvea_system( A , b )
+    A , b = preparer_systeme( A , b , overwrite_a , overwrite_b )
+    x = elimination_Gauss_Jordan( A , b.reshape( len( b ) , -1 ) , bloc )
+    return x.reshape( b.shape )
 
 # =============================================================================
 # La décomposition PA=LU d'un matrice 
 # =============================================================================
 
-def permutation( A , n , N ) :
-    T = np.identity( N )
-    m = A[ n ][ n ]
-    j = n
-    for i in range(n+1,N):
-        if m < abs( A[ i ][ n ] ):
-            m = A[ i ][ n ]
-            j = i
-    T[ n ][ n ] = 0
-    T[ j ][ n ] = 1
-    T[ j ][ j ] = 0
-    T[n][j]=1
-    A0 = T @ A
-    return T,A0
+class FactorisationLU :
+    """
+    Factorisation compacte ``P A = L U`` calculée en place avec pivot partiel.
+
+    L (à diagonale unitaire) et U sont rangées dans un même tableau ``lu`` ; la permutation est gardée
+    sous forme du vecteur d'entiers ``piv``, où la ligne ``i`` de ``P A`` est la ligne ``piv[ i ]`` de ``A``.
+    Les matrices denses P, L et U ne sont construites qu'à la demande.
+
+    Parameters
+    ----------
+    A : (N, N) array_like
+        Matrice à décomposer.
+    overwrite_a : bool, optional
+        Autoriser la factorisation directement dans ``A``. The default is False.
+    bloc : int, optional
+        Nombre de colonnes par panneau. The default is 64.
+
+    Attributes
+    ----------
+    lu : (N, N) ndarray
+        L sous la diagonale et U sur et au-dessus de la diagonale.
+    piv : ( N ) ndarray
+        Vecteur de permutation des lignes.
+    signe : int
+        Signature de la permutation.
+
+    """
+
+    def __init__( self , A , overwrite_a = False , bloc = 64 ) :
+        dtype = np.result_type( np.asarray( A ).dtype , float )
+        if overwrite_a :
+            lu = np.asarray( A , dtype = dtype , order = 'C' )
+        else:
+            lu = np.array( A , dtype = dtype , order = 'C' )
+        N = len( lu )
+        piv = np.arange( N )
+        signe = 1
+        for k in range(0,N,bloc):
+            kb = min( bloc , N - k )
+            J = slice( k , k + kb )
+            C = slice( k + kb , N )
+            for j in range(k,k+kb):
+                p = j + np.argmax( abs( lu[ j: , j ] ) )
+                if p != j :
+                    lu[ [ j , p ] ] = lu[ [ p , j ] ]
+                    piv[ [ j , p ] ] = piv[ [ p , j ] ]
+                    signe = -signe
+                if lu[ j ][ j ] != 0 :
+                    lu[ j+1: , j ] /= lu[ j ][ j ]
+                    lu[ j+1: , j+1:k+kb ] -= np.outer( lu[ j+1: , j ] , lu[ j , j+1:k+kb ] )
+            if k + kb < N :
+                for i in range(k+1,k+kb):
+                    lu[ i , C ] -= lu[ i , k:i ] @ lu[ k:i , C ]
+                lu[ C , C ] -= lu[ C , J ] @ lu[ J , C ]
+        self.lu = lu
+        self.piv = piv
+        self.signe = signe
+
+    @property
+    def P( self ) :
+        return np.identity( len( self.lu ) )[ self.piv ]
+
+    @property
+    def L( self ) :
+        return np.tril( self.lu , -1 ) + np.identity( len( self.lu ) )
+
+    @property
+    def U( self ) :
+        return np.triu( self.lu )
+
+    def solve( self , b , out = None ) :
+        """
+        Résoudre ``A x = b`` avec la factorisation.
+
+        Parameters
+        ----------
+        b : ( N ) or (N, K) array
+            Côté droit, ou K côtés droits rangés en colonnes.
+        out : ( N ) or (N, K) ndarray, optional
+            Tableau contigu, distinct de ``b``, où écrire la solution. The default is None.
+
+        Returns
+        -------
+        X : ( N ) or (N, K) array
+            Solution au système.
+
+        """
+        lu = self.lu
+        if np.any( np.diagonal( lu ) == 0 ) :
+            raise np.linalg.LinAlgError( "Matrice singulière" )
+        # b est converti avant la permutation : np.take refuse d'écrire des entiers dans un out flottant.
+        b = np.asarray( b , dtype = np.result_type( lu.dtype , np.asarray( b ).dtype , float ) )
+        if out is None :
+            X = b[ self.piv ]
+        else:
+            X = np.take( b , self.piv , axis = 0 , out = out )
+        resoudre_triangulaire( lu , X , inferieure = True , diag_unite = True , out = X )
+        resoudre_triangulaire( lu , X , inferieure = False , out = X )
+        return X
+
+    def det( self ) :
+        """
+        Calculer le déterminant de A.
+
+        Returns
+        -------
+        det : float
+            Le déterminant de A.
+
+        """
+        return self.signe * np.prod( np.diagonal( self.lu ) )
+
+    def logdet( self ) :
+        """
+        Calculer le logarithme du déterminant de A sans dépassement de capacité.
+
+        Returns
+        -------
+        signe : float
+            Le signe du déterminant (0 si A est singulière).
+        logdet : float
+            Le logarithme de la valeur absolue du déterminant.
+
+        """
+        d = np.diagonal( self.lu )
+        if np.any( d == 0 ) :
+            return 0.0 , -np.inf
+        signe = self.signe * np.prod( np.sign( d ) )
+        return signe , np.sum( np.log( abs( d ) ) )
 
 def Decomposition_LU_PA( A ) :
     """
@@ -143,85 +297,254 @@ def Decomposition_LU_PA( A ) :
         Matrice triangulaire supérieure.
 
     """
-    N = len( A )
-    A0 = A
-    P = L = np.identity( N )
-    n = 0
-    while n < N-1:
-        T,A0 = permutation( A0 , n , N )
-        P = T @ P
-        L = T @ L @ T
-        L0 = np.identity( N )
-        for i in range( n+1 , N ):
-            L0[ i ][ n ] = -A0[ i ][ n ] / A0[ n ][ n ]
-        A0 = L0 @ A0
-        L = L @ np.linalg.inv( L0 )
-        n = n+1
-    U = A0
-    return P,L,U  
+    F = FactorisationLU( A )
+    return F.P , F.L , F.U
+
+# =============================================================================
+# Cache des factorisations pour les résolutions répétées
+# =============================================================================
+
+class CacheFactorisations :
+    """
+    Cache LRU de taille bornée des factorisations de matrices de système.
+
+    Une factorisation est retrouvée par une empreinte du contenu de la matrice (forme, type et
+    hachage des octets, en O(N^2)) ou par une clé explicite fournie par l'utilisateur.
+
+    Parameters
+    ----------
+    taille_max : int, optional
+        Nombre maximal de factorisations gardées. The default is 8.
+
+    Attributes
+    ----------
+    hits : int
+        Nombre de factorisations retrouvées dans le cache.
+    misses : int
+        Nombre de factorisations calculées.
+    evictions : int
+        Nombre de factorisations retirées du cache pour respecter ``taille_max``.
+
+    """
+
+    def __init__( self , taille_max = 8 ) :
+        self.taille_max = taille_max
+        self.entrees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__( self ) :
+        return len( self.entrees )
+
+    @staticmethod
+    def empreinte( A ) :
+        A = np.ascontiguousarray( A )
+        h = hashlib.blake2b( A.view( np.uint8 ).reshape( -1 ) , digest_size = 16 )
+        return A.shape , A.dtype.str , h.hexdigest()
+
+    def obtenir( self , A , type , factoriser , cle = None ) :
+        """
+        Retourner la factorisation de A, en la calculant si elle n'est pas dans le cache.
+
+        Parameters
+        ----------
+        A : (N, N) array_like
+            Matrice de système.
+        type : str
+            Nom de la factorisation, pour distinguer LU et Choleski d'une même matrice.
+        factoriser : callable
+            Fonction calculant la factorisation.
+
+              ``factoriser( A ) -> object``
+        cle : hashable, optional
+            Clé explicite remplaçant l'empreinte du contenu. The default is None.
+
+        Returns
+        -------
+        F : object
+            La factorisation de A.
+
+        """
+        if cle is None :
+            cle = self.empreinte( A )
+        cle = ( type , cle )
+        if cle in self.entrees :
+            self.hits += 1
+            self.entrees.move_to_end( cle )
+            return self.entrees[ cle ]
+        self.misses += 1
+        F = factoriser( A )
+        if F is None :
+            return F
+        self.entrees[ cle ] = F
+        while len( self.entrees ) > self.taille_max :
+            self.entrees.popitem( last = False )
+            self.evictions += 1
+        return F
+
+    def vider( self ) :
+        self.entrees.clear()
+
+cache_factorisations = CacheFactorisations()
+
+def factorisation_en_cache( A , type , factoriser , cache , cle ) :
+    if cache is None or cache is False :
+        return factoriser( A )
+    if cache is True :
+        cache = cache_factorisations
+    return cache.obtenir( A , type , factoriser , cle )
 
 # =============================================================================
 # Résolution d'un système d'équations linéaires en utilisant la décomposition QLU 
 # =============================================================================
 
-def Dec_PA_LU_to_Solvea_system( A , b ) :
+def Dec_PA_LU_to_Solvea_system( A , b , cache = None , cle = None ) :
     """
     Résoudre un système d'équations, A x = b, en utilisant la factorisation LU de P A.
 
     Parameters
     ----------
-    A : (N, N) array_like
-        Matrice de système.
-    b : ( N ) array
-        Côté droit.
+    A : (N, N) array_like, FactorisationLU, MatriceCSR or scipy.sparse matrix
+        Matrice de système, ou sa factorisation déjà calculée pour la réutiliser. Une matrice creuse
+        est résolue par ``Creux_to_Solvea_system``.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+    cache : CacheFactorisations or bool, optional
+        Cache où chercher et ranger la factorisation ; True utilise ``cache_factorisations``.
+        The default is None (pas de cache).
+    cle : hashable, optional
+        Clé explicite de la matrice dans le cache, à la place de l'empreinte de son contenu.
+        The default is None.
 
     Returns
     -------
-    X : ( N ) array
+    X : ( N ) or (N, K) array
         Solution au système.
 
     """
-    P,L,U = Decomposition_LU_PA( A ) 
-    N = len( A )
-    b = P @ b
-    Y = X = np.zeros( N )
-    for i in range(0,N):
-        Y[ i ] = b[ i ]
-        for j in range(0,i):
-            Y[ i ] = Y[ i ] - Y[ j ] * L[ i ][ j ]
-        Y[ i ] = Y[ i ] / L[ i ][ i ]
-    for i in range(N-1,-1,-1):
-        X[ i ] = Y[ i ]
-        for j in range(i+1,N):
-            X[ i ] = X[ i ] - X[ j ] * U[ i ][ j ]
-        X[ i ] = X[ i ] / U[ i ][ i ]
-    return X
+    if est_creuse( A ) :
+        return Creux_to_Solvea_system( A , b )
+    if not isinstance( A , FactorisationLU ) :
+        A = factorisation_en_cache( A , 'LU' , FactorisationLU , cache , cle )
+    return A.solve( b )
 
 # =============================================================================
 # La décomposition de Choleski d'un matrice
 # =============================================================================
 
-def determinant_sous_matrice( A , N ) :
-    SA = np.zeros(( N , N ))
-    for i in range(0,N):
-            for j in range(0,N):
-                SA[ i ][ j ] = A[ i ][ j ]
-    return np.linalg.det( SA ) 
+def Choleski_partiel( A , bloc = 64 ) :
+    """
+    Tenter la décomposition de Choleski de A en s'arrêtant au premier pivot non positif.
 
-def define_positif( A ) :
-    N = len( A )
-    for n in range(1,N+1):
-        if determinant_sous_matrice( A , n ) <= 0 :
-            return False
-    return True
+    Le même passage sert de test de définie positivité et de factorisation. Le facteur est calculé
+    colonne par colonne par produits scalaires vectorisés, les colonnes des panneaux précédents étant
+    reportées par un produit matriciel par bloc. Une pile de matrices est factorisée en un seul appel.
+
+    Parameters
+    ----------
+    A : (N, N) or (B, N, N) array_like
+        Matrice symétrique, ou pile de B matrices symétriques.
+    bloc : int, optional
+        Nombre de colonnes par panneau. The default is 64.
+
+    Returns
+    -------
+    L : (N, N) or (B, N, N) ndarray
+        Facteur triangulaire inférieur, complet si ``k == N`` et partiel sinon
+        (seules les ``k`` premières colonnes sont calculées).
+    k : int or (B) ndarray
+        Nombre de pivots positifs trouvés ; A est définie positive si et seulement si ``k == N``.
+
+    """
+    A = np.asarray( A , dtype = float )
+    pile = A.ndim == 3
+    L = np.tril( A if pile else A[ None ] )
+    B , N = L.shape[ 0 ] , L.shape[ 1 ]
+    k = np.full( B , N )
+    ok = np.ones( B , dtype = bool )
+    with np.errstate( invalid = 'ignore' , over = 'ignore' , divide = 'ignore' ) :
+        for j0 in range(0,N,bloc):
+            J = slice( j0 , min( j0 + bloc , N ) )
+            if j0 > 0 :
+                L[ : , j0: , J ] -= L[ : , j0: , :j0 ] @ L[ : , J , :j0 ].transpose( 0 , 2 , 1 )
+            for j in range(J.start,J.stop):
+                if j > j0 :
+                    L[ : , j: , j ] -= ( L[ : , j: , j0:j ] @ L[ : , j , j0:j , None ] )[ ... , 0 ]
+                d = L[ : , j , j ]
+                echec = ok & ~( d > 0 )
+                if echec.any() :
+                    k[ echec ] = j
+                    ok &= ~echec
+                    if not ok.any() :
+                        break
+                r = np.sqrt( np.where( ok , d , 1 ) )
+                L[ : , j , j ] = r
+                L[ : , j+1: , j ] /= r[ : , None ]
+            if not ok.any() :
+                break
+    # Le report par bloc touche aussi la partie supérieure des panneaux.
+    L = np.tril( L )
+    for b in np.flatnonzero( ~ok ) :
+        L[ b , : , k[ b ]: ] = 0
+    if pile :
+        return L , k
+    return L[ 0 ] , int( k[ 0 ] )
 
-def symetrique( A ) :
+def Choleski_modifie( A , beta = 1e-3 , essais = 60 ) :
+    """
+    Factoriser ``A + tau I`` par Choleski avec le plus petit décalage ``tau`` essayé qui la rend définie positive.
+
+    Sans décalage si A est déjà définie positive ; sinon ``tau`` part de ``max( beta , -min( diag( A ) ) + beta )``
+    (à l'échelle de A) et est multiplié par 10 jusqu'au succès (décalage de Levenberg), au plus ``essais`` fois.
+
+    Parameters
+    ----------
+    A : (N, N) array_like
+        Matrice symétrique.
+    beta : float, optional
+        Décalage relatif minimal. The default is 1e-3.
+    essais : int, optional
+        Nombre maximal de décalages essayés. The default is 60.
+
+    Returns
+    -------
+    L : (N, N) ndarray
+        Facteur de Choleski de ``A + tau I``.
+    tau : float
+        Le décalage utilisé.
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        Si A contient des valeurs non finies ou si aucun décalage essayé ne convient.
+
+    """
+    A = np.asarray( A , dtype = float )
+    if not np.all( np.isfinite( A ) ) :
+        raise np.linalg.LinAlgError( "La matrice contient des valeurs non finies" )
     N = len( A )
-    for i in range(0,N):
-        for j in range(i+1,N):
-            if( A[ i ][ j ] != A[ j ][ i ] ) :
-              return False
-    return True
+    L , k = Choleski_partiel( A )
+    if k == N :
+        return L , 0.0
+    echelle = max( abs( A ).max( initial = 0 ) , 1.0 )
+    dmin = np.diagonal( A ).min( initial = 0 )
+    tau = max( beta * echelle , -dmin + beta * echelle )
+    for essai in range(0,essais):
+        L , k = Choleski_partiel( A + tau * np.eye( N ) )
+        if k == N :
+            return L , tau
+        tau = 10 * tau
+    raise np.linalg.LinAlgError( "Aucun décalage ne rend la matrice définie positive" )
+
+def define_positif( A ) :
+    A = np.asarray( A )
+    return Choleski_partiel( A )[ 1 ] == A.shape[ -1 ]
+
+def symetrique( A , tol = 1e-12 ) :
+    A = np.asarray( A )
+    ecart = abs( A - np.swapaxes( A , -1 , -2 ) ).max( axis = ( -2 , -1 ) , initial = 0 )
+    return bool( np.all( ecart <= tol * abs( A ).max( axis = ( -2 , -1 ) , initial = 0 ) ) )
 
 def Dec_Choleski( A ) :
     """
@@ -229,70 +552,857 @@ def Dec_Choleski( A ) :
 
     Parameters
     ----------
-    A : (N, N) array_like
-        Matrice à décomposer.
+    A : (N, N) or (B, N, N) array_like
+        Matrice à décomposer, ou pile de B matrices factorisées en un seul appel.
 
     Returns
     -------
-    L : (N, N) array_like
+    L : (N, N) or (B, N, N) array_like
         Matrice triangulaire inférieure de la décomposition.
 
     """
+    A = np.asarray( A )
     if symetrique( A ) :
-        if define_positif( A ) :
-            N = len( A )
-            L = np.zeros(( N , N ))
-            for i in range(0,N):
-                for k in range(0,i):
-                    L[ i ][ i ] = L[ i ][ i ] + L[ i ][ k ] * L[ i ][ k ]
-                L[ i ][ i ] = A[ i ][ i ] - L[ i ][ i ]
-                L[ i ][ i ] = np.sqrt( L[ i ][ i ] )
-                for j in range(i+1,N):
-                    L[ j ][ i ] = A[ i ][ j ]
-                    for k in range(0,i):
-                       L[ j ][ i ] = L[ j ][ i ] - L[ i ][ k ] * L[ j ][ k ]
-                    L[ j ][ i ] = L[ j ][ i ] / L[ i ][ i ]
-
+        L , k = Choleski_partiel( A )
+        if np.all( k == A.shape[ -1 ] ) :
             return L
         else:
             print("Donnes un matrice define positif\n")
     else:
           print("Donnes un matrice symetrique\n")
 
+def resoudre_Choleski( L , b , out = None ) :
+    """
+    Résoudre ``L L.T x = b`` connaissant le facteur de Choleski L.
+
+    Parameters
+    ----------
+    L : (N, N) array_like
+        Matrice triangulaire inférieure de la décomposition.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+    out : ( N ) or (N, K) ndarray, optional
+        Tableau contigu où écrire la solution ; il peut être ``b`` lui-même. The default is None.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    X = resoudre_triangulaire( L , b , inferieure = True , out = out )
+    return resoudre_triangulaire( L , X , inferieure = True , transposee = True , out = X )
+
 # =============================================================================
 # Résolution d'un système d'équations linéaires en utilisant la décomposition de Choleski
 # =============================================================================
 
-def Choleski_to_Solvea_system( A , b ) :
+def Choleski_to_Solvea_system( A , b , cache = None , cle = None ) :
     """
     Résoudre un système d'équations, A x = b, en utilisant la décomposition de Choleski de A.
 
     Parameters
     ----------
-    A : (N, N) array_like
+    A : (N, N) array_like, MatriceCSR or scipy.sparse matrix
+        Matrice de système. Une matrice creuse est résolue par ``Creux_to_Solvea_system``.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+    cache : CacheFactorisations or bool, optional
+        Cache où chercher et ranger la factorisation ; True utilise ``cache_factorisations``.
+        The default is None (pas de cache).
+    cle : hashable, optional
+        Clé explicite de la matrice dans le cache, à la place de l'empreinte de son contenu.
+        The default is None.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    if est_creuse( A ) :
+        return Creux_to_Solvea_system( A , b , symetrique_defini_positif = True )
+    L = factorisation_en_cache( A , 'Choleski' , Dec_Choleski , cache , cle )
+    return resoudre_Choleski( L , b )
+
+# =============================================================================
+# Systèmes à bande et tridiagonaux
+# =============================================================================
+
+def Thomas( a , b , c , d ) :
+    """
+    Résoudre un système tridiagonal par l'algorithme de Thomas, en O(N).
+
+    Aucun pivotage n'est fait : la matrice doit être par exemple à diagonale dominante ou définie positive.
+
+    Parameters
+    ----------
+    a : ( N-1 ) array_like
+        Sous-diagonale.
+    b : ( N ) array_like
+        Diagonale.
+    c : ( N-1 ) array_like
+        Sur-diagonale.
+    d : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    a = np.asarray( a , dtype = float ).tolist()
+    b = np.asarray( b , dtype = float ).tolist()
+    c = np.asarray( c , dtype = float ).tolist()
+    X = np.array( d , dtype = float )
+    N = len( b )
+    # Les coefficients sont éliminés en flottants Python, plus rapides que des scalaires NumPy.
+    w = [ 0.0 ] * N
+    q = [ 0.0 ] * N
+    q[ 0 ] = b[ 0 ]
+    for i in range(1,N):
+        if q[ i-1 ] == 0 :
+            raise np.linalg.LinAlgError( "Pivot nul dans l'algorithme de Thomas" )
+        w[ i ] = a[ i-1 ] / q[ i-1 ]
+        q[ i ] = b[ i ] - w[ i ] * c[ i-1 ]
+    if q[ N-1 ] == 0 :
+        raise np.linalg.LinAlgError( "Pivot nul dans l'algorithme de Thomas" )
+    if X.ndim == 1 :
+        y = X.tolist()
+        for i in range(1,N):
+            y[ i ] -= w[ i ] * y[ i-1 ]
+        y[ N-1 ] /= q[ N-1 ]
+        for i in range(N-2,-1,-1):
+            y[ i ] = ( y[ i ] - c[ i ] * y[ i+1 ] ) / q[ i ]
+        X[ : ] = y
+    else:
+        for i in range(1,N):
+            X[ i ] -= w[ i ] * X[ i-1 ]
+        X[ N-1 ] /= q[ N-1 ]
+        for i in range(N-2,-1,-1):
+            X[ i ] -= c[ i ] * X[ i+1 ]
+            X[ i ] /= q[ i ]
+    return X
+
+def bande_vers_lignes( ab , l , u , marge ) :
+    # Range la bande par lignes : D[ i , k ] = A[ i , i - l + k ], complétée de ``marge`` lignes nulles.
+    # Dans ce rangement les éléments A[ j + r , j + c ] forment un rectangle d'une vue à pas constants.
+    N = ab.shape[ 1 ]
+    D = np.zeros(( N + marge , l + u + 1 ))
+    for k in range(0,l+u+1):
+        d = k - l
+        D[ max( 0 , -d ):N - max( 0 , d ) , k ] = ab[ u - d , max( 0 , d ):N + min( 0 , d ) ]
+    return D
+
+def lignes_vers_bande( D , l , u , N ) :
+    ab = np.zeros(( l + u + 1 , N ))
+    for k in range(0,l+u+1):
+        d = k - l
+        ab[ u - d , max( 0 , d ):N + min( 0 , d ) ] = D[ max( 0 , -d ):N - max( 0 , d ) , k ]
+    return ab
+
+def bande_inferieure_vers_lignes( ab ) :
+    # D[ j , k ] = A[ j + k , j ] = A[ j , j + k ] : la colonne j de L devient la ligne j de D.
+    p = ab.shape[ 0 ] - 1
+    N = ab.shape[ 1 ]
+    D = np.zeros(( N + p , p + 1 ))
+    D[ :N ] = ab.T
+    for k in range(1,p+1):
+        D[ max( 0 , N - k ):N , k ] = 0
+    return D
+
+def vue_blocs( D , l , u ) :
+    # W[ j ][ r , c ] = A[ j + r , j + c ] pour 0 <= r <= l et 0 <= c <= u.
+    w = D.shape[ 1 ]
+    s = D.itemsize
+    N = D.shape[ 0 ] - l
+    return np.lib.stride_tricks.as_strided( D.reshape( -1 )[ l: ] , shape = ( N , l + 1 , u + 1 ) , strides = ( w * s , ( w - 1 ) * s , s ) )
+
+def Decomposition_LU_bande( ab , l , u ) :
+    """
+    Calculer la décomposition LU, sans pivotage, d'une matrice à bande en stockage compact.
+
+    La matrice A de largeurs de bande ``l`` (sous la diagonale) et ``u`` (au-dessus) est rangée
+    dans ``ab`` de forme (l+u+1, N) avec ``ab[ u + i - j , j ] = A[ i , j ]``. Le coût est
+    O(N l u) et la mémoire O(N (l+u)).
+
+    Parameters
+    ----------
+    ab : (l+u+1, N) array_like
+        Matrice à décomposer, en stockage à bande.
+    l : int
+        Nombre de sous-diagonales.
+    u : int
+        Nombre de sur-diagonales.
+
+    Returns
+    -------
+    lub : (l+u+1, N) ndarray
+        U dans les ``u+1`` premières lignes et les multiplicateurs de L (diagonale unitaire)
+        dans les ``l`` dernières, avec le même rangement que ``ab``.
+
+    """
+    ab = np.asarray( ab , dtype = float )
+    N = ab.shape[ 1 ]
+    D = bande_vers_lignes( ab , l , u , l )
+    W = vue_blocs( D , l , u )
+    for j in range(0,N):
+        B = W[ j ]
+        if B[ 0 , 0 ] == 0 :
+            raise np.linalg.LinAlgError( "Pivot nul dans la décomposition LU à bande" )
+        B[ 1: , 0 ] /= B[ 0 , 0 ]
+        B[ 1: , 1: ] -= np.multiply.outer( B[ 1: , 0 ] , B[ 0 , 1: ] )
+    return lignes_vers_bande( D , l , u , N )
+
+def resoudre_LU_bande( lub , l , u , b ) :
+    """
+    Résoudre ``A x = b`` connaissant la décomposition LU à bande de A.
+
+    Parameters
+    ----------
+    lub : (l+u+1, N) ndarray
+        Résultat de ``Decomposition_LU_bande``.
+    l : int
+        Nombre de sous-diagonales.
+    u : int
+        Nombre de sur-diagonales.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    N = lub.shape[ 1 ]
+    b = np.asarray( b , dtype = float )
+    W = vue_blocs( bande_vers_lignes( lub , l , u , l ) , l , u )
+    Y = np.zeros(( N + max( l , u ) , b.size // N ))
+    Y[ :N ] = b.reshape( N , -1 )
+    for j in range(0,N):
+        Y[ j+1:j+1+l ] -= np.multiply.outer( W[ j , 1: , 0 ] , Y[ j ] )
+    for j in range(N-1,-1,-1):
+        Y[ j ] -= W[ j , 0 , 1: ] @ Y[ j+1:j+1+u ]
+        Y[ j ] /= W[ j , 0 , 0 ]
+    return Y[ :N ].reshape( b.shape )
+
+def LU_bande_to_Solvea_system( ab , l , u , b ) :
+    """
+    Résoudre un système d'équations à bande, A x = b, par décomposition LU sans pivotage.
+
+    Un système tridiagonal (``l == u == 1``) est résolu directement par l'algorithme de Thomas.
+
+    Parameters
+    ----------
+    ab : (l+u+1, N) array_like
+        Matrice de système, en stockage à bande ``ab[ u + i - j , j ] = A[ i , j ]``.
+    l : int
+        Nombre de sous-diagonales.
+    u : int
+        Nombre de sur-diagonales.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    ab = np.asarray( ab , dtype = float )
+    if l == 1 and u == 1 :
+        return Thomas( ab[ 2 , :-1 ] , ab[ 1 ] , ab[ 0 , 1: ] , b )
+    return resoudre_LU_bande( Decomposition_LU_bande( ab , l , u ) , l , u , b )
+
+def Decomposition_LU_bande_pivot( ab , l , u ) :
+    """
+    Calculer la décomposition LU avec pivot partiel, P A = L U, d'une matrice à bande en stockage compact.
+
+    Le pivot de la colonne j est cherché parmi les ``l`` lignes sous la diagonale ; les échanges de lignes
+    élargissent la bande de U à ``l + u`` sur-diagonales. Le coût reste O(N l (l+u)).
+
+    Parameters
+    ----------
+    ab : (l+u+1, N) array_like
+        Matrice à décomposer, en stockage à bande ``ab[ u + i - j , j ] = A[ i , j ]``.
+    l : int
+        Nombre de sous-diagonales.
+    u : int
+        Nombre de sur-diagonales.
+
+    Returns
+    -------
+    lub : (l+v+1, N) ndarray
+        U (``v = min( l + u , N - 1 )`` sur-diagonales) dans les ``v+1`` premières lignes et les
+        multiplicateurs de L dans les ``l`` dernières, rangés comme par ``Decomposition_LU_bande`` avec
+        ``u`` remplacé par ``v``.
+    piv : ( N ) ndarray
+        La ligne échangée avec la ligne j à l'étape j.
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        Si la matrice est singulière.
+
+    """
+    ab = np.asarray( ab , dtype = float )
+    N = ab.shape[ 1 ]
+    v = min( l + u , N - 1 )
+    large = np.zeros(( l + v + 1 , N ))
+    large[ v - u: ] = ab
+    D = bande_vers_lignes( large , l , v , l )
+    W = vue_blocs( D , l , v )
+    piv = np.empty( N , dtype = np.intp )
+    for j in range(0,N):
+        B = W[ j ]
+        r = int( np.argmax( abs( B[ : , 0 ] ) ) )
+        if B[ r , 0 ] == 0 :
+            raise np.linalg.LinAlgError( "Matrice singulière" )
+        piv[ j ] = j + r
+        if r :
+            # Seules les colonnes j et suivantes sont échangées : les multiplicateurs déjà rangés restent en place.
+            B[ [ 0 , r ] ] = B[ [ r , 0 ] ]
+        B[ 1: , 0 ] /= B[ 0 , 0 ]
+        B[ 1: , 1: ] -= np.multiply.outer( B[ 1: , 0 ] , B[ 0 , 1: ] )
+    return lignes_vers_bande( D , l , v , N ) , piv
+
+def resoudre_LU_bande_pivot( lub , l , u , piv , b ) :
+    """
+    Résoudre ``A x = b`` connaissant la décomposition ``Decomposition_LU_bande_pivot`` de A.
+
+    Parameters
+    ----------
+    lub , piv :
+        Résultat de ``Decomposition_LU_bande_pivot``.
+    l : int
+        Nombre de sous-diagonales de A.
+    u : int
+        Nombre de sur-diagonales de A.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    N = lub.shape[ 1 ]
+    v = min( l + u , N - 1 )
+    b = np.asarray( b , dtype = float )
+    W = vue_blocs( bande_vers_lignes( lub , l , v , l ) , l , v )
+    Y = np.zeros(( N + v , b.size // N ))
+    Y[ :N ] = b.reshape( N , -1 )
+    for j in range(0,N):
+        p = piv[ j ]
+        if p != j :
+            Y[ [ j , p ] ] = Y[ [ p , j ] ]
+        Y[ j+1:j+1+l ] -= np.multiply.outer( W[ j , 1: , 0 ] , Y[ j ] )
+    for j in range(N-1,-1,-1):
+        Y[ j ] -= W[ j , 0 , 1: ] @ Y[ j+1:j+1+v ]
+        Y[ j ] /= W[ j , 0 , 0 ]
+    return Y[ :N ].reshape( b.shape )
+
+def Choleski_bande_partiel( ab ) :
+    """
+    Tenter la décomposition de Choleski d'une matrice symétrique à bande en s'arrêtant au premier pivot non positif.
+
+    La partie inférieure de A, de largeur de bande ``p``, est rangée dans ``ab`` de forme (p+1, N) avec
+    ``ab[ i - j , j ] = A[ i , j ]`` pour ``i >= j``. Le coût est O(N p^2).
+
+    Parameters
+    ----------
+    ab : (p+1, N) array_like
+        Matrice symétrique, en stockage à bande inférieure.
+
+    Returns
+    -------
+    Lb : (p+1, N) ndarray
+        Facteur L avec le même rangement que ``ab`` ; seules les ``k`` premières colonnes sont valables.
+    k : int
+        Nombre de pivots positifs trouvés ; A est définie positive si et seulement si ``k == N``.
+
+    """
+    ab = np.asarray( ab , dtype = float )
+    p = ab.shape[ 0 ] - 1
+    N = ab.shape[ 1 ]
+    D = bande_inferieure_vers_lignes( ab )
+    w = p + 1
+    Dplat = D.reshape( -1 )
+    ia , ib = np.triu_indices( p )
+    # A[ j + a , j + b ] pour 1 <= a <= b <= p est rangé en D[ j + a , b - a ].
+    decalage = ( ia + 1 ) * w + ib - ia
+    k = N
+    for j in range(0,N):
+        d = D[ j , 0 ]
+        if not d > 0 :
+            k = j
+            break
+        D[ j , 0 ] = np.sqrt( d )
+        v = D[ j , 1: ]
+        v /= D[ j , 0 ]
+        Dplat[ j * w + decalage ] -= np.multiply.outer( v , v )[ ia , ib ]
+    return D[ :N ].T.copy() , k
+
+def Dec_Choleski_bande( ab ) :
+    """
+    Calculer la décomposition ``A = L L.T`` d'une matrice symétrique définie positive à bande.
+
+    Parameters
+    ----------
+    ab : (p+1, N) array_like
+        Matrice à décomposer, en stockage à bande inférieure ``ab[ i - j , j ] = A[ i , j ]``.
+
+    Returns
+    -------
+    Lb : (p+1, N) ndarray
+        Facteur L, avec le même rangement que ``ab``.
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        Si la matrice n'est pas définie positive.
+
+    """
+    Lb , k = Choleski_bande_partiel( ab )
+    if k < Lb.shape[ 1 ] :
+        raise np.linalg.LinAlgError( "Matrice non définie positive (pivot %d)" % k )
+    return Lb
+
+def resoudre_Choleski_bande( Lb , b ) :
+    """
+    Résoudre ``L L.T x = b`` connaissant le facteur de Choleski à bande L.
+
+    Parameters
+    ----------
+    Lb : (p+1, N) ndarray
+        Résultat de ``Dec_Choleski_bande``.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    p = Lb.shape[ 0 ] - 1
+    N = Lb.shape[ 1 ]
+    b = np.asarray( b , dtype = float )
+    D = bande_inferieure_vers_lignes( Lb )
+    Y = np.zeros(( N + p , b.size // N ))
+    Y[ :N ] = b.reshape( N , -1 )
+    for j in range(0,N):
+        Y[ j ] /= D[ j , 0 ]
+        Y[ j+1:j+1+p ] -= np.multiply.outer( D[ j , 1: ] , Y[ j ] )
+    for j in range(N-1,-1,-1):
+        Y[ j ] -= D[ j , 1: ] @ Y[ j+1:j+1+p ]
+        Y[ j ] /= D[ j , 0 ]
+    return Y[ :N ].reshape( b.shape )
+
+def Choleski_bande_to_Solvea_system( ab , b ) :
+    """
+    Résoudre un système d'équations symétrique défini positif à bande, A x = b, par la décomposition de Choleski.
+
+    Parameters
+    ----------
+    ab : (p+1, N) array_like
+        Matrice de système, en stockage à bande inférieure ``ab[ i - j , j ] = A[ i , j ]``.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    Lb = Dec_Choleski_bande( ab )
+    return resoudre_Choleski_bande( Lb , b )
+
+# =============================================================================
+# Matrices creuses : factorisation renumérotée et méthodes de Krylov
+# =============================================================================
+
+def bande_creuse( A , p , inferieure ) :
+    # Extrait la bande de la matrice renumérotée P A P.T en stockage compact, sans la former en dense.
+    N = A.shape[ 0 ]
+    q = np.empty( N , dtype = np.intp )
+    q[ p ] = np.arange( N )
+    i = q[ A.indices_lignes() ]
+    j = q[ A.indices ]
+    v = A.data
+    if inferieure :
+        garde = i >= j
+        i , j , v = i[ garde ] , j[ garde ] , v[ garde ]
+        ab = np.zeros(( int( np.max( i - j , initial = 0 ) ) + 1 , N ))
+        np.add.at( ab , ( i - j , j ) , v )
+        return ab
+    l = int( np.max( i - j , initial = 0 ) )
+    u = int( np.max( j - i , initial = 0 ) )
+    ab = np.zeros(( l + u + 1 , N ))
+    np.add.at( ab , ( u + i - j , j ) , v )
+    return ab , l , u
+
+def Creux_to_Solvea_system( A , b , symetrique_defini_positif = False ) :
+    """
+    Résoudre un système d'équations creux, A x = b, par factorisation directe après renumérotation.
+
+    La matrice est renumérotée par Cuthill-McKee inverse pour réduire sa largeur de bande, puis factorisée
+    par LU à bande avec pivot partiel (ou Choleski à bande si elle est symétrique définie positive). Le
+    remplissage reste confiné dans la bande : la mémoire est O(N bw) au lieu de O(N^2).
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix or (N, N) array_like
+        Matrice de système.
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+    symetrique_defini_positif : bool, optional
+        Utiliser la décomposition de Choleski. The default is False.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système.
+
+    """
+    A = en_CSR( A )
+    p = Cuthill_McKee_inverse( A )
+    b = np.asarray( b , dtype = float )
+    if symetrique_defini_positif :
+        Lb = Dec_Choleski_bande( bande_creuse( A , p , True ) )
+        Y = resoudre_Choleski_bande( Lb , b[ p ] )
+    else:
+        ab , l , u = bande_creuse( A , p , False )
+        lub , piv = Decomposition_LU_bande_pivot( ab , l , u )
+        Y = resoudre_LU_bande_pivot( lub , l , u , piv , b[ p ] )
+    X = np.empty_like( Y )
+    X[ p ] = Y
+    return X
+
+def operateur( A ) :
+    # Retourne le produit matrice-vecteur x -> A x ; A peut être une matrice dense ou creuse, un objet
+    # muni d'une méthode ``matvec`` (comme scipy.sparse.linalg.LinearOperator) ou une fonction.
+    if est_creuse( A ) :
+        A = en_CSR( A )
+    elif hasattr( A , 'matvec' ) :
+        return A.matvec
+    elif callable( A ) :
+        return A
+    else:
+        A = np.asarray( A , dtype = float )
+    return lambda x : A @ x
+
+def preconditionneur_Jacobi( A ) :
+    """
+    Construire le préconditionneur de Jacobi ``r -> r / diag( A )``.
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix or (N, N) array_like
+        Matrice de système.
+
+    Returns
+    -------
+    M : callable
+        Application du préconditionneur, ``M( r ) -> ndarray``.
+
+    """
+    d = en_CSR( A ).diagonal() if est_creuse( A ) else np.diagonal( np.asarray( A , dtype = float ) ).copy()
+    d[ d == 0 ] = 1
+    inv_d = 1 / d
+    return lambda r : inv_d * r
+
+def preconditionneur_Choleski_incomplet( A , decalage = 1e-3 ) :
+    """
+    Construire le préconditionneur de Choleski incomplet IC(0) de A.
+
+    Le facteur L garde la structure creuse de la partie inférieure de A. Si un pivot non positif
+    apparaît, la factorisation est reprise sur ``A + alpha diag( A )`` avec ``alpha`` croissant à
+    partir de ``decalage``.
+
+    Les substitutions par L et L.T sont faites par niveaux (``TriangulaireCreuse``) : une application
+    coûte O(nnz) opérations, mais en autant d'étapes vectorisées que de niveaux (environ 2 sqrt(N) pour
+    un laplacien 2-D). La factorisation elle-même est faite ligne par ligne. Le préconditionneur est donc
+    rentable quand il réduit fortement le nombre d'itérations ou quand il sert pour plusieurs résolutions ;
+    sinon ``'jacobi'`` est moins cher.
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix or (N, N) array_like
+        Matrice symétrique définie positive.
+    decalage : float, optional
+        Premier décalage relatif de la diagonale en cas d'échec. The default is 1e-3.
+
+    Returns
+    -------
+    M : callable
+        Application du préconditionneur, ``M( r ) -> ndarray`` qui résout ``L L.T z = r``.
+
+    """
+    A = en_CSR( A )
+    N = A.shape[ 0 ]
+    lignes = A.indices_lignes()
+    garde = A.indices <= lignes
+    T = MatriceCSR.depuis_coordonnees( lignes[ garde ] , A.indices[ garde ] , A.data[ garde ] , A.shape )
+    diag = T.diagonal()
+    if np.any( diag <= 0 ) :
+        raise np.linalg.LinAlgError( "La diagonale doit être strictement positive" )
+    alpha = 0.0
+    while True :
+        L = T.data.copy()
+        L[ T.indices == T.indices_lignes() ] += alpha * diag
+        lignes_L = [ ]
+        echec = False
+        for i in range(0,N):
+            debut , fin = T.indptr[ i ] , T.indptr[ i+1 ]
+            ligne = { }
+            for e in range(debut,fin):
+                k = T.indices[ e ]
+                ligne_k = lignes_L[ k ] if k < i else ligne
+                somme = sum( v * ligne_k.get( j , 0.0 ) for j , v in ligne.items() if j < k )
+                if k < i :
+                    ligne[ k ] = ( L[ e ] - somme ) / ligne_k[ k ]
+                else:
+                    d = L[ e ] - somme
+                    if not d > 0 :
+                        echec = True
+                        break
+                    ligne[ k ] = np.sqrt( d )
+            if echec :
+                break
+            lignes_L.append( ligne )
+            L[ debut:fin ] = [ ligne[ k ] for k in T.indices[ debut:fin ] ]
+        if not echec :
+            break
+        alpha = decalage if alpha == 0 else 2 * alpha
+    L = MatriceCSR( L , T.indices , T.indptr , T.shape )
+    # Les deux substitutions sont préparées une fois et faites par niveaux, en O(nnz) vectorisé.
+    descente = TriangulaireCreuse( L , inferieure = True )
+    remontee = TriangulaireCreuse( L.T , inferieure = False )
+    def M( r ) :
+        z = descente.resoudre( r )
+        return remontee.resoudre( z , out = z )
+    return M
+
+def Gradient_conjugue_to_Solvea_system( A , b , x0 = None , tol = 1e-8 , maxiter = None , M = None , historique = False ) :
+    """
+    Résoudre un système symétrique défini positif, A x = b, par la méthode du gradient conjugué préconditionné.
+
+    Seuls des produits matrice-vecteur sont utilisés : A peut n'être connue que par son action ``x -> A x``,
+    et chaque itération coûte O(nnz).
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix, (N, N) array_like, callable or LinearOperator
+        Matrice de système, ou opérateur ``A( x ) -> ndarray`` / objet muni d'une méthode ``matvec``.
+    b : ( N ) array
+        Côté droit.
+    x0 : ( N ) array, optional
+        Point initial, pour repartir d'une solution voisine. The default is None (vecteur nul).
+    tol : float, optional
+        Tolérance relative sur le résidu, ``||b - A x|| <= tol ||b||``. The default is 1e-8.
+    maxiter : int, optional
+        Nombre maximal d'itérations. The default is None (10 N).
+    M : str or callable, optional
+        Préconditionneur : ``'jacobi'``, ``'choleski_incomplet'`` (A doit alors être une matrice, pas un
+        opérateur ; voir ``preconditionneur_Choleski_incomplet`` pour son coût), ou une fonction
+        ``M( r ) -> ndarray`` approchant ``A^-1 r`` (par exemple ``lambda r : r / d`` pour le préconditionneur
+        de Jacobi d'un opérateur de diagonale d). The default is None.
+    historique : bool, optional
+        Retourner aussi la norme du résidu à chaque itération. The default is False.
+
+    Returns
+    -------
+    X : ( N ) array
+        Solution au système.
+    residus : list
+        Normes des résidus, seulement si ``historique`` est vrai.
+
+    Warns
+    -----
+    RuntimeWarning
+        Si le résidu n'a pas atteint la tolérance après ``maxiter`` itérations.
+
+    """
+    Ax = operateur( A )
+    if isinstance( M , str ) and not est_creuse( A ) and ( callable( A ) or hasattr( A , 'matvec' ) ) :
+        raise ValueError( "le préconditionneur %r demande la matrice A, pas un opérateur : "
+                          "donner M( r ) sous forme de fonction" % ( M , ) )
+    if M == 'jacobi' :
+        M = preconditionneur_Jacobi( A )
+    elif M == 'choleski_incomplet' :
+        M = preconditionneur_Choleski_incomplet( A )
+    b = np.asarray( b , dtype = float )
+    N = len( b )
+    X = np.zeros( N ) if x0 is None else np.array( x0 , dtype = float )
+    maxiter = 10 * N if maxiter is None else maxiter
+    seuil = tol * ( np.linalg.norm( b ) or 1 )
+    r = b - Ax( X )
+    z = r if M is None else M( r )
+    d = np.array( z , dtype = float )
+    rz = r @ z
+    residus = [ np.linalg.norm( r ) ]
+    for k in range(0,maxiter):
+        if residus[ -1 ] <= seuil :
+            break
+        Ad = Ax( d )
+        a = rz / ( d @ Ad )
+        X += a * d
+        r -= a * Ad
+        residus.append( np.linalg.norm( r ) )
+        z = r if M is None else M( r )
+        rz , rz0 = r @ z , rz
+        d *= rz / rz0
+        d += z
+    if residus[ -1 ] > seuil :
+        warnings.warn( "Le gradient conjugué n'a pas convergé" , RuntimeWarning , stacklevel = 2 )
+    if historique :
+        return X , residus
+    return X
+
+def GMRES_to_Solvea_system( A , b , x0 = None , tol = 1e-8 , redemarrage = 30 , maxiter = None ) :
+    """
+    Résoudre un système d'équations, A x = b, par la méthode GMRES avec redémarrage.
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix or (N, N) array_like
         Matrice de système.
     b : ( N ) array
         Côté droit.
+    x0 : ( N ) array, optional
+        Point initial. The default is None (vecteur nul).
+    tol : float, optional
+        Tolérance relative sur le résidu, ``||b - A x|| <= tol ||b||``. The default is 1e-8.
+    redemarrage : int, optional
+        Dimension de l'espace de Krylov avant redémarrage. The default is 30.
+    maxiter : int, optional
+        Nombre maximal d'itérations (produits matrice-vecteur). The default is None (10 N).
 
     Returns
     -------
     X : ( N ) array
         Solution au système.
 
+    Warns
+    -----
+    RuntimeWarning
+        Si le résidu n'a pas atteint la tolérance après ``maxiter`` itérations.
+
     """
-    L = Dec_Choleski( A )
-    LT = np.transpose( L )
-    N = len( A )
-    Y = X = np.zeros( N )
-    for i in range(0,N):
-        Y[ i ] = b[ i ]
-        for j in range(0,i):
-            Y[ i ] = Y[ i ] - Y[ j ] * L[ i ][ j ]
-        Y[ i ] = Y[ i ] / L[ i ][ i ]
-    for i in range(N-1,-1,-1):
-        X[ i ] = Y[ i ]
-        for j in range(i+1,N):
-            X[ i ] = X[ i ] - X[ j ] * LT[ i ][ j ]
-        X[ i ] = X[ i ] / LT[ i ][ i ]
+    Ax = operateur( A )
+    b = np.asarray( b , dtype = float )
+    N = len( b )
+    X = np.zeros( N ) if x0 is None else np.array( x0 , dtype = float )
+    maxiter = 10 * N if maxiter is None else maxiter
+    seuil = tol * ( np.linalg.norm( b ) or 1 )
+    m = min( redemarrage , N )
+    V = np.zeros(( m + 1 , N ))
+    H = np.zeros(( m + 1 , m ))
+    c = np.zeros( m )
+    s = np.zeros( m )
+    g = np.zeros( m + 1 )
+    it = 0
+    r = b - Ax( X )
+    beta = np.linalg.norm( r )
+    while beta > seuil and it < maxiter :
+        V[ 0 ] = r / beta
+        g[ : ] = 0
+        g[ 0 ] = beta
+        for k in range(0,m):
+            it += 1
+            w = Ax( V[ k ] )
+            # Gram-Schmidt classique répété deux fois.
+            h = V[ :k+1 ] @ w
+            w -= h @ V[ :k+1 ]
+            h2 = V[ :k+1 ] @ w
+            w -= h2 @ V[ :k+1 ]
+            H[ :k+1 , k ] = h + h2
+            H[ k+1 , k ] = np.linalg.norm( w )
+            if H[ k+1 , k ] != 0 :
+                V[ k+1 ] = w / H[ k+1 , k ]
+            for i in range(0,k):
+                H[ i , k ] , H[ i+1 , k ] = c[ i ] * H[ i , k ] + s[ i ] * H[ i+1 , k ] , -s[ i ] * H[ i , k ] + c[ i ] * H[ i+1 , k ]
+            rho = np.hypot( H[ k , k ] , H[ k+1 , k ] )
+            c[ k ] , s[ k ] = H[ k , k ] / rho , H[ k+1 , k ] / rho
+            H[ k , k ] = rho
+            H[ k+1 , k ] = 0
+            g[ k+1 ] = -s[ k ] * g[ k ]
+            g[ k ] = c[ k ] * g[ k ]
+            if abs( g[ k+1 ] ) <= seuil or it >= maxiter or s[ k ] == 0 :
+                break
+        y = resoudre_triangulaire( H[ :k+1 , :k+1 ] , g[ :k+1 ] , inferieure = False )
+        X += y @ V[ :k+1 ]
+        r = b - Ax( X )
+        beta = np.linalg.norm( r )
+    if beta > seuil :
+        warnings.warn( "GMRES n'a pas convergé" , RuntimeWarning , stacklevel = 2 )
     return X
 
+def BiCGSTAB_to_Solvea_system( A , b , x0 = None , tol = 1e-8 , maxiter = None ) :
+    """
+    Résoudre un système d'équations, A x = b, par la méthode BiCGSTAB.
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix or (N, N) array_like
+        Matrice de système.
+    b : ( N ) array
+        Côté droit.
+    x0 : ( N ) array, optional
+        Point initial. The default is None (vecteur nul).
+    tol : float, optional
+        Tolérance relative sur le résidu, ``||b - A x|| <= tol ||b||``. The default is 1e-8.
+    maxiter : int, optional
+        Nombre maximal d'itérations. The default is None (10 N).
+
+    Returns
+    -------
+    X : ( N ) array
+        Solution au système.
+
+    Warns
+    -----
+    RuntimeWarning
+        Si le résidu n'a pas atteint la tolérance après ``maxiter`` itérations.
+
+    """
+    Ax = operateur( A )
+    b = np.asarray( b , dtype = float )
+    N = len( b )
+    X = np.zeros( N ) if x0 is None else np.array( x0 , dtype = float )
+    maxiter = 10 * N if maxiter is None else maxiter
+    seuil = tol * ( np.linalg.norm( b ) or 1 )
+    r = b - Ax( X )
+    r0 = r.copy()
+    p = np.zeros( N )
+    v = np.zeros( N )
+    rho = alpha = omega = 1.0
+    for k in range(0,maxiter):
+        if np.linalg.norm( r ) <= seuil :
+            return X
+        rho , rho0 = r0 @ r , rho
+        if rho == 0 :
+            break
+        p -= omega * v
+        p *= ( rho / rho0 ) * ( alpha / omega )
+        p += r
+        v = Ax( p )
+        alpha = rho / ( r0 @ v )
+        r -= alpha * v
+        X += alpha * p
+        if np.linalg.norm( r ) <= seuil :
+            return X
+        t = Ax( r )
+        omega = ( t @ r ) / ( t @ t )
+        X += omega * r
+        r -= omega * t
+        if omega == 0 :
+            break
+    if np.linalg.norm( r ) > seuil :
+        warnings.warn( "BiCGSTAB n'a pas convergé" , RuntimeWarning , stacklevel = 2 )
+    return X
@@ -0,0 +1,350 @@
+#=================================================\\Documentation//==================================================
+
+"""
+This module contains the finite-difference derivatives used by multivariate_optimization when no analytic gradient
+or Hessian is given: forward, central and complex-step gradients, Hessian-vector products obtained by differencing
+gradients, and Hessians obtained either by differencing gradients or directly from values of f, every stencil point
+being evaluated once. The evaluations of f at the perturbed points are independent: they can be spread over a
+thread or process pool, or any user-supplied ``map``. numdifftools can still be chosen as backend; it is only
+imported when it is.
+
+"""
+
+#================================================\\Libraries needed//================================================
+
+import numpy as np
+import importlib
+
+#===============================================\\Difference stencils//==============================================
+
+def pas_differences( x , methode = 'central' ) :
+    """
+    Calculer les pas de différentiation adaptés à chaque composante de x.
+
+    Parameters
+    ----------
+    x : ndarray, shape (n,)
+        Point de différentiation.
+    methode : str, optional
+        ``'forward'``, ``'central'`` ou ``'complex'``. The default is 'central'.
+
+    Returns
+    -------
+    h : ndarray, shape (n,)
+        Les pas, tels que ``x + h`` soit représentable exactement.
+
+    """
+    x = np.asarray( x , dtype = float )
+    if methode == 'complex' :
+        return np.full( x.shape , 1e-20 )
+    eps = np.finfo( float ).eps
+    h = ( np.sqrt( eps ) if methode == 'forward' else np.cbrt( eps ) ) * np.maximum( 1.0 , np.abs( x ) )
+    return ( x + h ) - x
+
+def points_gradient( x , h , methode = 'central' ) :
+    """
+    Construire les points où ``f`` est évaluée pour approcher son gradient en x.
+
+    Parameters
+    ----------
+    x : ndarray, shape (n,)
+        Point de différentiation.
+    h : ndarray, shape (n,)
+        Les pas.
+    methode : str, optional
+        ``'forward'`` (n points, plus ``f( x )``), ``'central'`` (2n points) ou ``'complex'`` (n points complexes).
+        The default is 'central'.
+
+    Returns
+    -------
+    X : ndarray, shape (m, n)
+        Les points, un par ligne.
+
+    """
+    x = np.asarray( x , dtype = float )
+    E = np.diag( h )
+    if methode == 'forward' :
+        return x + E
+    if methode == 'central' :
+        return np.vstack(( x + E , x - E ))
+    if methode == 'complex' :
+        return x + 1j * E
+    raise ValueError( "méthode de différences inconnue : %r" % ( methode , ) )
+
+def combiner_gradient( F , h , methode = 'central' , f0 = None ) :
+    """
+    Combiner les valeurs de ``f`` aux points de ``points_gradient`` en une approximation du gradient.
+
+    """
+    F = np.asarray( F )
+    if methode == 'forward' :
+        return ( F.real - f0 ) / h
+    if methode == 'central' :
+        n = len( h )
+        return ( F[ :n ].real - F[ n: ].real ) / ( 2 * h )
+    return F.imag / h
+
+#=============================================\\Finite-difference derivatives//======================================
+
+class DifferencesFinies :
+    """
+    Dérivées d'une fonction de plusieurs variables par différences finies.
+
+    Parameters
+    ----------
+    f : callable
+        La fonction, ``f( x ) -> float`` où ``x`` est un 1-D array with shape (n,). Avec ``vectorized=True``,
+        ``f`` reçoit aussi un tableau de forme (n, m) dont chaque colonne est un point et retourne les m valeurs.
+    methode : str, optional
+        ``'forward'``, ``'central'`` ou ``'complex'`` (``f`` doit alors accepter des arguments complexes).
+        The default is 'central'.
+    vectorized : bool, optional
+        Évaluer tous les points d'un gradient en un seul appel de ``f``. The default is False.
+    executeur : str, concurrent.futures.Executor or callable, optional
+        Répartition des évaluations de ``f`` : None (en série), ``'threads'``, ``'processus'`` (``f`` doit alors
+        se sérialiser avec pickle), un exécuteur existant, qui n'est pas fermé, ou une fonction
+        ``map( f , points )`` comme ``multiprocessing.Pool.map``. Ignoré avec ``vectorized=True``.
+        The default is None.
+    max_workers : int, optional
+        Nombre de threads ou de processus du pool créé pour ``'threads'`` ou ``'processus'``. The default is None.
+
+    Attributes
+    ----------
+    nfev : int
+        Nombre de points où ``f`` a été évaluée.
+
+    Notes
+    -----
+    Les résultats ne dépendent pas de l'exécuteur : seuls l'ordre et le lieu des évaluations changent.
+    Le pool créé pour ``'threads'`` ou ``'processus'`` est gardé d'un appel à l'autre ; ``fermer()`` le
+    libère, ce que fait aussi la sortie d'un bloc ``with``.
+
+    """
+
+    def __init__( self , f , methode = 'central' , vectorized = False , executeur = None , max_workers = None ) :
+        if methode not in ( 'forward' , 'central' , 'complex' ) :
+            raise ValueError( "méthode de différences inconnue : %r" % ( methode , ) )
+        if isinstance( executeur , str ) and executeur not in ( 'threads' , 'processus' ) :
+            raise ValueError( "exécuteur inconnu : %r" % ( executeur , ) )
+        self.f = f
+        self.methode = methode
+        self.vectorized = vectorized
+        self.executeur = executeur
+        self.max_workers = max_workers
+        self.pool = None
+        self.nfev = 0
+
+    def carte( self ) :
+        # La fonction map qui répartit les évaluations, ou None en série.
+        executeur = self.executeur
+        if executeur is None :
+            return None
+        if isinstance( executeur , str ) :
+            if self.pool is None :
+                futures = importlib.import_module( 'concurrent.futures' )
+                Pool = futures.ThreadPoolExecutor if executeur == 'threads' else futures.ProcessPoolExecutor
+                self.pool = Pool( self.max_workers )
+            return self.pool.map
+        if hasattr( executeur , 'submit' ) :
+            return executeur.map
+        return executeur
+
+    def fermer( self ) :
+        """
+        Fermer le pool créé pour ``executeur='threads'`` ou ``'processus'``.
+
+        """
+        if self.pool is not None :
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__( self ) :
+        return self
+
+    def __exit__( self , *exception ) :
+        self.fermer()
+
+    def evaluer( self , X ) :
+        # Les points sont les lignes de X.
+        self.nfev += len( X )
+        if self.vectorized :
+            return np.asarray( self.f( X.T ) )
+        carte = self.carte()
+        if carte is None :
+            return np.array([ self.f( x ) for x in X ])
+        return np.array( list( carte( self.f , X ) ) )
+
+    def stencil( self , x , f0 = None ) :
+        # Pas et points d'un gradient en x ; en différences avant sans f0, x lui-même est le dernier point.
+        h = pas_differences( x , self.methode )
+        X = points_gradient( x , h , self.methode )
+        if self.methode == 'forward' and f0 is None :
+            X = np.vstack(( X , x ))
+        return h , X
+
+    def combiner( self , F , h , f0 = None ) :
+        if self.methode == 'forward' and f0 is None :
+            f0 , F = F[ -1 ].real , F[ :-1 ]
+        return combiner_gradient( F , h , self.methode , f0 )
+
+    def gradient( self , x , f0 = None ) :
+        """
+        Approcher le gradient de ``f`` en x ; ``f0 = f( x )`` évite une évaluation en différences avant.
+
+        """
+        x = np.asarray( x , dtype = float )
+        h , X = self.stencil( x , f0 )
+        return self.combiner( self.evaluer( X ) , h , f0 )
+
+    __call__ = gradient
+
+    def gradients( self , points ) :
+        """
+        Approcher le gradient de ``f`` en chacun des points (les lignes de ``points``) ; les points des
+        stencils sont évalués en un seul appel, ce qui les répartit ensemble sur l'exécuteur.
+
+        """
+        stencils = [ self.stencil( x ) for x in np.asarray( points , dtype = float ) ]
+        F = self.evaluer( np.vstack([ X for h , X in stencils ]) )
+        G = [ ]
+        debut = 0
+        for h , X in stencils :
+            G.append( self.combiner( F[ debut:debut + len( X ) ] , h ) )
+            debut += len( X )
+        return G
+
+    def parallele( self , df ) :
+        # Regrouper les gradients internes n'a d'intérêt que s'ils sont répartis sur un exécuteur.
+        return ( df is None or df == self.gradient ) and self.executeur is not None and not self.vectorized
+
+    def ordre_pas( self , df ) :
+        # Différentier un gradient lui-même approché demande un pas plus grand que pour un gradient exact.
+        methode = 'forward' if self.methode == 'forward' else 'central'
+        if df is None or df == self.gradient and self.methode != 'complex' :
+            return methode , ( 1 / 4 if methode == 'forward' else 2 / 9 )
+        return methode , ( 1 / 2 if methode == 'forward' else 1 / 3 )
+
+    def hessienne_directe( self , x ) :
+        """
+        Approcher la matrice hessienne de ``f`` en x directement à partir des valeurs de ``f``, chaque point
+        n'étant évalué qu'une fois : ``f( x )`` et ``f( x ± h_i )`` sont partagés par tous les termes.
+
+        En différences centrées, ``H[ i , j ]`` vient des quatre points ``x ± h_i ± h_j`` (2n² + 1 évaluations
+        en tout) ; en différences avant, de ``x + h_i + h_j``, ``x + h_i``, ``x + h_j`` et ``x``
+        (n(n+3)/2 + 1 évaluations). Les points sont soumis par paquets d'environ 4n.
+
+        """
+        x = np.asarray( x , dtype = float )
+        n = len( x )
+        avant = self.methode == 'forward'
+        # Erreur de troncature O(h) ou O(h^2) contre erreur d'arrondi O(eps / h^2).
+        h = np.finfo( float ).eps ** ( 1 / 3 if avant else 1 / 4 ) * np.maximum( 1.0 , np.abs( x ) )
+        h = ( x + h ) - x
+        E = np.diag( h )
+        H = np.empty(( n , n ))
+        F = self.evaluer( np.vstack(( x , x + E )) if avant else np.vstack(( x , x + E , x - E )) ).real
+        f0 , Fp = F[ 0 ] , F[ 1:n+1 ]
+        if not avant :
+            H[ range(0,n) , range(0,n) ] = ( Fp - 2 * f0 + F[ n+1: ] ) / h ** 2
+        I , J = np.triu_indices( n , 0 if avant else 1 )
+        taille = 4 * n if avant else n
+        for debut in range(0,len( I ),taille):
+            i , j = I[ debut:debut + taille ] , J[ debut:debut + taille ]
+            if avant :
+                Fij = self.evaluer( x + E[ i ] + E[ j ] ).real
+                H[ i , j ] = ( Fij - Fp[ i ] - Fp[ j ] + f0 ) / ( h[ i ] * h[ j ] )
+            else:
+                Ei , Ej = E[ i ] , E[ j ]
+                Fij = self.evaluer( np.vstack(( x + Ei + Ej , x + Ei - Ej , x - Ei + Ej , x - Ei - Ej )) ).real
+                Fij = Fij.reshape( 4 , -1 )
+                H[ i , j ] = ( Fij[ 0 ] - Fij[ 1 ] - Fij[ 2 ] + Fij[ 3 ] ) / ( 4 * h[ i ] * h[ j ] )
+        I , J = np.triu_indices( n , 1 )
+        H[ J , I ] = H[ I , J ]
+        return H
+
+    def hessienne( self , x , df = None ) :
+        """
+        Approcher la matrice hessienne de ``f`` en x en différentiant le gradient ``df``, colonne par colonne.
+        Sans ``df``, en différences avant ou centrées, la hessienne est calculée par ``hessienne_directe``.
+
+        """
+        if ( df is None or df == self.gradient ) and self.methode != 'complex' :
+            return self.hessienne_directe( x )
+        methode , ordre = self.ordre_pas( df )
+        parallele = self.parallele( df )
+        df = self.gradient if df is None else df
+        x = np.asarray( x , dtype = float )
+        n = len( x )
+        h = np.finfo( float ).eps ** ordre * np.maximum( 1.0 , np.abs( x ) )
+        h = ( x + h ) - x
+        E = np.diag( h )
+        if methode == 'forward' :
+            g0 = np.asarray( df( x ) , dtype = float )
+            H = np.column_stack([ ( df( x + E[ j ] ) - g0 ) / h[ j ] for j in range(0,n) ])
+        elif parallele :
+            # Une colonne à la fois : au plus 2n points complexes en attente.
+            H = np.empty(( n , n ))
+            for j in range(0,n):
+                g1 , g2 = self.gradients([ x + E[ j ] , x - E[ j ] ])
+                H[ : , j ] = ( g1 - g2 ) / ( 2 * h[ j ] )
+        else:
+            H = np.column_stack([ ( df( x + E[ j ] ) - df( x - E[ j ] ) ) / ( 2 * h[ j ] ) for j in range(0,n) ])
+        return ( H + H.T ) / 2
+
+    def hessp( self , x , p , df = None , g0 = None ) :
+        """
+        Approcher le produit de la hessienne de ``f`` en x par p en différentiant le gradient ``df``
+        dans la direction p ; ``g0 = df( x )`` évite une évaluation en différences avant.
+
+        """
+        methode , ordre = self.ordre_pas( df )
+        parallele = self.parallele( df )
+        df = self.gradient if df is None else df
+        x = np.asarray( x , dtype = float )
+        p = np.asarray( p , dtype = float )
+        norme = np.linalg.norm( p )
+        if norme == 0 :
+            return np.zeros_like( x )
+        h = np.finfo( float ).eps ** ordre * max( 1.0 , np.linalg.norm( x ) ) / norme
+        if parallele and not ( methode == 'forward' and g0 is not None ) :
+            if methode == 'forward' :
+                g0 , g1 = self.gradients([ x , x + h * p ])
+                return ( g1 - g0 ) / h
+            g1 , g2 = self.gradients([ x + h * p , x - h * p ])
+            return ( g1 - g2 ) / ( 2 * h )
+        if methode == 'forward' :
+            g0 = np.asarray( df( x ) , dtype = float ) if g0 is None else g0
+            return ( df( x + h * p ) - g0 ) / h
+        return ( df( x + h * p ) - df( x - h * p ) ) / ( 2 * h )
+
+def derivees_numeriques( f , methode = 'central' , vectorized = False ) :
+    """
+    Construire le gradient et la hessienne numériques de f.
+
+    Parameters
+    ----------
+    f : callable
+        La fonction, ``f( x ) -> float``.
+    methode : str, optional
+        ``'forward'``, ``'central'``, ``'complex'`` ou ``'numdifftools'`` (importé seulement dans ce cas).
+        The default is 'central'.
+    vectorized : bool, optional
+        Voir ``DifferencesFinies``. The default is False.
+
+    Returns
+    -------
+    df : callable
+        Le gradient, ``df( x ) -> ndarray, shape (n,)``.
+    d2f : callable
+        La hessienne, ``d2f( x ) -> ndarray, shape (n, n)``.
+    D : DifferencesFinies or None
+        L'objet qui compte les évaluations (None avec numdifftools).
+
+    """
+    if methode == 'numdifftools' :
+        nd = importlib.import_module( 'numdifftools' )
+        return nd.Gradient( f ) , nd.Hessian( f ) , None
+    D = DifferencesFinies( f , methode , vectorized )
+    return D.gradient , D.hessienne , D
+
+#====================================================================================================================
@@ -0,0 +1,306 @@
+#=================================================\\Documentation//==================================================
+
+"""
+This module contains a multi-start driver for the local methods of univariate_optimization and
+multivariate_optimization: starting points spread over a box (Latin hypercube or Sobol) are run in parallel on a
+``concurrent.futures`` pool of processes or threads and the local minima are merged into one result.
+concurrent.futures, cloudpickle and scipy are only imported when they are needed.
+
+"""
+
+#================================================\\Libraries needed//================================================
+
+import numpy as np
+import math as m
+import importlib
+import pickle
+import warnings
+from .optimization_result import ResultatOptimisation
+
+#==================================================\\Starting points//===============================================
+
+def hypercube_latin( n , bornes , graine = None ) :
+    """
+    Tirer n points dans une boîte par hypercube latin : chaque intervalle de chaque coordonnée,
+    découpé en n tranches égales, contient exactement un point.
+
+    Parameters
+    ----------
+    n : int
+        Nombre de points.
+    bornes : array_like, shape (d, 2)
+        Les intervalles ``[ a , b ]`` de chaque coordonnée.
+    graine : int or numpy.random.Generator, optional
+        Graine du générateur aléatoire. The default is None.
+
+    Returns
+    -------
+    X : ndarray, shape (n, d)
+        Les points, un par ligne.
+
+    """
+    bornes = np.asarray( bornes , dtype = float )
+    d = len( bornes )
+    rng = np.random.default_rng( graine )
+    tranches = rng.permuted( np.tile( np.arange( n ) , ( d , 1 ) ) , axis = 1 ).T
+    U = ( tranches + rng.random( ( n , d ) ) ) / n
+    return bornes[ : , 0 ] + U * ( bornes[ : , 1 ] - bornes[ : , 0 ] )
+
+def points_Sobol( n , bornes , graine = None ) :
+    """
+    Tirer les n premiers points d'une suite de Sobol brouillée dans une boîte (scipy est importé à ce moment).
+
+    Parameters
+    ----------
+    n : int
+        Nombre de points.
+    bornes : array_like, shape (d, 2)
+        Les intervalles ``[ a , b ]`` de chaque coordonnée.
+    graine : int or numpy.random.Generator, optional
+        Graine du brouillage. The default is None.
+
+    Returns
+    -------
+    X : ndarray, shape (n, d)
+        Les points, un par ligne.
+
+    """
+    qmc = importlib.import_module( 'scipy.stats.qmc' )
+    bornes = np.asarray( bornes , dtype = float )
+    # Les propriétés d'équirépartition ne valent que pour une puissance de 2 : on la tire puis on tronque.
+    U = qmc.Sobol( len( bornes ) , rng = graine ).random_base2( max( 0 , m.ceil( m.log2( n ) ) ) )[ :n ]
+    return bornes[ : , 0 ] + U * ( bornes[ : , 1 ] - bornes[ : , 0 ] )
+
+def points_depart( n , bornes , echantillonnage = 'lhs' , graine = None ) :
+    """
+    Construire les points de départ de la recherche multi-départ.
+
+    Parameters
+    ----------
+    n : int
+        Nombre de points.
+    bornes : array_like, shape (d, 2)
+        Les intervalles ``[ a , b ]`` de chaque coordonnée.
+    echantillonnage : str, optional
+        ``'lhs'`` (hypercube latin), ``'sobol'`` ou ``'uniforme'``. The default is 'lhs'.
+    graine : int or numpy.random.Generator, optional
+        Graine du générateur aléatoire. The default is None.
+
+    Returns
+    -------
+    X : ndarray, shape (n, d)
+        Les points, un par ligne.
+
+    """
+    if echantillonnage == 'lhs' :
+        return hypercube_latin( n , bornes , graine )
+    if echantillonnage == 'sobol' :
+        return points_Sobol( n , bornes , graine )
+    if echantillonnage == 'uniforme' :
+        bornes = np.asarray( bornes , dtype = float )
+        U = np.random.default_rng( graine ).random( ( n , len( bornes ) ) )
+        return bornes[ : , 0 ] + U * ( bornes[ : , 1 ] - bornes[ : , 0 ] )
+    raise ValueError( "échantillonnage inconnu : %r" % ( echantillonnage , ) )
+
+#=====================================================\\Workers//====================================================
+
+def recherche_locale( methode , f , options , x0 ) :
+    """
+    Lancer une recherche locale depuis x0 et ramener son résultat à ``( x , fun , nfev , njev )``.
+
+    """
+    res = methode( x0 , f , **options )
+    nfev , njev = 0 , 0
+    if isinstance( res , ResultatOptimisation ) :
+        x , fun , nfev , njev = res.x , res.fun , res.nfev , res.njev
+    elif isinstance( res , tuple ) :
+        x , fun = res[ 0 ] , None
+    else:
+        x , fun = res , None
+    if fun is None :
+        # La méthode ne connaît pas la valeur finale (Newton par exemple) : une évaluation de plus.
+        fun = f( x )
+        nfev += 1
+    return x , float( fun ) , nfev , njev
+
+def recherche_locale_serialisee( tache , x0 ) :
+    # La tâche a été sérialisée par cloudpickle ; pickle sait la relire si cloudpickle est installé.
+    methode , f , options = pickle.loads( tache )
+    return recherche_locale( methode , f , options , x0 )
+
+def preparer_tache( methode , f , options ) :
+    """
+    Préparer la fonction et les arguments envoyés à un processus : tels quels s'ils se sérialisent avec pickle,
+    sérialisés par cloudpickle sinon (lambda, fonction locale...), None si ni l'un ni l'autre ne convient.
+
+    """
+    try:
+        pickle.dumps(( methode , f , options ))
+        return recherche_locale , ( methode , f , options )
+    except Exception :
+        pass
+    try:
+        cloudpickle = importlib.import_module( 'cloudpickle' )
+        return recherche_locale_serialisee , ( cloudpickle.dumps(( methode , f , options )) , )
+    except Exception :
+        return None
+
+#==================================================\\Multi-start driver//============================================
+
+class ResultatMultiDepart( ResultatOptimisation ) :
+    """
+    Résultat de ``multi_depart`` : le meilleur minimum local, et le détail de chaque départ.
+
+    Attributes
+    ----------
+    departs : ndarray, shape (N, d)
+        Les points de départ, dans l'ordre où ils ont été tirés.
+    minima : list
+        Le minimum local trouvé depuis chaque départ (None pour un départ annulé).
+    valeurs : ndarray, shape (N,)
+        La valeur de la fonction en chaque minimum local (nan pour un départ annulé).
+
+    """
+
+    __slots__ = ( 'departs' , 'minima' , 'valeurs' )
+
+    def __repr__( self ) :
+        noms = ResultatOptimisation.__slots__ + ( 'valeurs' , )
+        return "\n".join( "%10s: %r" % ( nom , getattr( self , nom ) ) for nom in noms )
+
+def creer_executeur( executeur , max_workers , tache ) :
+    # Retourne ( pool , à fermer par nous ) ; None quand les départs sont lancés en série.
+    if executeur is None or executeur == 'serie' :
+        return None , False
+    if not isinstance( executeur , str ) :
+        return executeur , False
+    futures = importlib.import_module( 'concurrent.futures' )
+    if executeur == 'processus' :
+        if tache is None :
+            warnings.warn( "la fonction ou la méthode ne se sérialise pas (installer cloudpickle) : "
+                           "les départs sont lancés dans des threads" , RuntimeWarning , stacklevel = 3 )
+            return futures.ThreadPoolExecutor( max_workers ) , True
+        return futures.ProcessPoolExecutor( max_workers ) , True
+    if executeur == 'threads' :
+        return futures.ThreadPoolExecutor( max_workers ) , True
+    raise ValueError( "exécuteur inconnu : %r" % ( executeur , ) )
+
+def multi_depart( methode , f , bornes , n_departs = 16 , echantillonnage = 'lhs' , graine = None ,
+                  executeur = 'processus' , max_workers = None , cible = None , options = None ) :
+    """
+    Recherche globale par départs multiples : la méthode locale est lancée depuis ``n_departs`` points
+    répartis dans la boîte ``bornes``, en parallèle, et le meilleur minimum local est retenu.
+
+    Parameters
+    ----------
+    methode : callable
+        La méthode locale, appelée ``methode( x0 , f , **options )`` ; elle retourne un ``ResultatOptimisation``,
+        un couple ``( x , historique )`` ou x. Par exemple ``methode_gradient``, ``Quasi_Newton_and_armijo``,
+        ``Newton_CG`` ou, en dimension 1, ``Quasi_Newton`` de univariate_optimization.
+    f : callable
+        La fonction objective à minimiser, ``f( x ) -> float``. Avec des processus, ``f`` et ``methode`` doivent
+        se sérialiser avec pickle (fonction définie au niveau d'un module) ou avec cloudpickle s'il est installé.
+    bornes : array_like, shape (d, 2) or (2,)
+        Les intervalles ``[ a , b ]`` de chaque coordonnée ; un seul couple ``( a , b )`` pour une méthode
+        univariée, qui reçoit alors des x0 scalaires.
+    n_departs : int, optional
+        Nombre de points de départ. The default is 16.
+    echantillonnage : str or array_like, optional
+        ``'lhs'`` (hypercube latin), ``'sobol'`` (scipy), ``'uniforme'`` ou directement les points de départ,
+        un par ligne. The default is 'lhs'.
+    graine : int, optional
+        Graine de l'échantillonnage. The default is None.
+    executeur : str or concurrent.futures.Executor, optional
+        ``'processus'``, ``'threads'``, ``'serie'`` (ou None), ou un exécuteur existant, qui n'est pas fermé.
+        Sans pickle ni cloudpickle, ``'processus'`` se rabat sur des threads. The default is 'processus'.
+    max_workers : int, optional
+        Nombre de processus ou de threads (par défaut celui de ``concurrent.futures``). The default is None.
+    cible : float, optional
+        Valeur à atteindre : dès qu'un départ donne ``fun <= cible``, les départs suivants sont annulés.
+        The default is None.
+    options : dict, optional
+        Arguments supplémentaires de la méthode locale (``tol``, ``jac``...). The default is None.
+
+    Returns
+    -------
+     res : ResultatMultiDepart
+        ``x`` et ``fun`` du meilleur minimum local ; ``nit`` est le nombre de recherches locales terminées,
+        ``nfev`` et ``njev`` leurs totaux, et ``historique`` les minima locaux dans l'ordre des départs.
+
+    Notes
+    -----
+    Le résultat ne dépend pas de l'ordre dans lequel les départs se terminent : le meilleur minimum est celui de
+    plus petite valeur, les égalités étant départagées par l'indice du départ. Avec ``cible``, seuls les départs
+    d'indice supérieur au premier qui l'atteint sont annulés ; les précédents sont menés à terme, de sorte que
+    le départ retenu, le premier qui atteint la cible, est toujours le même.
+
+    """
+    options = {} if options is None else dict( options )
+    scalaire = np.ndim( bornes ) == 1
+    bornes = np.atleast_2d( np.asarray( bornes , dtype = float ) )
+    if isinstance( echantillonnage , str ) :
+        departs = points_depart( n_departs , bornes , echantillonnage , graine )
+    else:
+        departs = np.atleast_2d( np.asarray( echantillonnage , dtype = float ) )
+    N = len( departs )
+    x0s = [ float( x[ 0 ] ) if scalaire else x for x in departs ]
+
+    # Un exécuteur fourni peut être un pool de processus : la tâche est alors préparée de la même façon.
+    serie_ou_threads = executeur is None or executeur in ( 'serie' , 'threads' )
+    tache = None if serie_ou_threads else preparer_tache( methode , f , options )
+    pool , fermer = creer_executeur( executeur , max_workers , tache )
+    if tache is None :
+        tache = recherche_locale , ( methode , f , options )
+    fonction , arguments = tache
+
+    resultats = [ None ] * N
+    atteinte = N
+    if pool is None :
+        for i in range(0,N):
+            resultats[ i ] = fonction( *arguments , x0s[ i ] )
+            if cible is not None and resultats[ i ][ 1 ] <= cible :
+                atteinte = i
+                break
+    else:
+        futures = importlib.import_module( 'concurrent.futures' )
+        try:
+            en_cours = { pool.submit( fonction , *arguments , x0s[ i ] ) : i for i in range(0,N) }
+            while en_cours :
+                finis , _ = futures.wait( en_cours , return_when = futures.FIRST_COMPLETED )
+                for future in finis :
+                    i = en_cours.pop( future )
+                    resultats[ i ] = future.result()
+                    if cible is not None and resultats[ i ][ 1 ] <= cible and i < atteinte :
+                        atteinte = i
+                        for autre , j in list( en_cours.items() ) :
+                            if j > i :
+                                autre.cancel()
+                                del en_cours[ autre ]
+        finally:
+            if fermer :
+                pool.shutdown( wait = True , cancel_futures = True )
+
+    # Fusion dans l'ordre des départs, indépendante de l'ordre de terminaison.
+    if atteinte < N :
+        for i in range(atteinte+1,N):
+            resultats[ i ] = None
+    termines = [ i for i in range(0,N) if resultats[ i ] is not None ]
+    valeurs = np.full( N , np.nan )
+    for i in termines :
+        valeurs[ i ] = resultats[ i ][ 1 ]
+    meilleur = atteinte if atteinte < N else min( termines , key = lambda i : ( valeurs[ i ] , i ) )
+    x , fun = resultats[ meilleur ][ :2 ]
+    minima = [ None if r is None else r[ 0 ] for r in resultats ]
+    if atteinte < N :
+        message = "Valeur cible atteinte depuis le départ %d." % ( atteinte , )
+    else:
+        message = "Optimisation terminée avec succès."
+    res = ResultatMultiDepart( x , fun , len( termines ) , sum( resultats[ i ][ 2 ] for i in termines ) ,
+                               sum( resultats[ i ][ 3 ] for i in termines ) , 0 , message ,
+                               np.array([ minima[ i ] for i in termines ]) )
+    res.departs = departs
+    res.minima = minima
+    res.valeurs = valeurs
+    return res
+
+#====================================================================================================================
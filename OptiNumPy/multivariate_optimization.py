@@ -9,8 +9,114 @@ such as Newton method, Gradient descent, Conjugate Gradient...
 #================================================\\Libraries needed//================================================
 
 import numpy as np
-import numdifftools as nd
 import math as m
+from .equation_solving import Choleski_modifie , resoudre_Choleski
+from .optimization_result import ResultatOptimisation , historique_depuis
+from .finite_differences import DifferencesFinies , derivees_numeriques
+
+#===================================================\Derivatives//==================================================
+
+class MemoireDernierPoint :
+    """
+    Enveloppe d'une fonction qui garde sa dernière valeur : un nouvel appel au même point
+    ne réévalue pas la fonction.
+
+    """
+
+    __slots__ = ( 'f' , 'x' , 'valeur' , 'nfev' )
+
+    def __init__( self , f ) :
+        self.f = f
+        self.x = None
+        self.valeur = None
+        self.nfev = 0
+
+    def __call__( self , x ) :
+        if self.x is None or not np.array_equal( x , self.x ) :
+            self.valeur = self.f( x )
+            self.x = np.array( x )
+            self.nfev += 1
+        return self.valeur
+
+class Derivees :
+    """
+    Fonction objective d'un problème et ses dérivées, avec comptage des évaluations.
+
+    Les dérivées qui ne sont pas fournies sont calculées par différences finies : le gradient à partir
+    de ``f``, la hessienne et les produits hessienne-vecteur en différentiant le gradient.
+
+    Parameters
+    ----------
+    f : callable
+        La fonction objective, ``f( x ) -> float``, ou ``f( x ) -> ( float , ndarray )`` si ``jac`` vaut True.
+    jac : callable or bool, optional
+        Le gradient, ``jac( x ) -> ndarray, shape (n,)`` ; True si ``f`` retourne la valeur et le gradient
+        calculés ensemble. The default is None.
+    hess : callable, optional
+        La matrice hessienne, ``hess( x ) -> ndarray, shape (n, n)``. The default is None.
+    hessp : callable, optional
+        Le produit de la hessienne par un vecteur, ``hessp( x , p ) -> ndarray, shape (n,)``. The default is None.
+    differences : str or DifferencesFinies, optional
+        ``'forward'``, ``'central'``, ``'complex'`` ou ``'numdifftools'``, ou un ``DifferencesFinies`` déjà
+        construit (par exemple pour une ``f`` vectorisée, ou dont les évaluations sont réparties sur un pool
+        avec ``executeur``). The default is 'central'.
+
+    Attributes
+    ----------
+    f , df , d2f , hessp : callable
+        La fonction, le gradient et la hessienne (tous deux mémorisés au dernier point) et le produit
+        hessienne-vecteur.
+
+    """
+
+    def __init__( self , f , jac = None , hess = None , hessp = None , differences = 'central' ) :
+        d2f_numdifftools = None
+        if isinstance( differences , DifferencesFinies ) :
+            self.differences = differences
+        elif differences == 'numdifftools' :
+            self.differences = DifferencesFinies( f , 'central' )
+        else:
+            self.differences = DifferencesFinies( f , differences )
+        if jac is True :
+            # Une seule évaluation de f donne la valeur et le gradient au même point.
+            self.fg = MemoireDernierPoint( f )
+            self.f = lambda x : self.fg( x )[ 0 ]
+            gradient = lambda x : np.asarray( self.fg( x )[ 1 ] , dtype = float )
+        else:
+            self.fg = None
+            self.f = MemoireDernierPoint( f )
+            if callable( jac ) :
+                gradient = jac
+            elif differences == 'numdifftools' :
+                gradient , d2f_numdifftools , _ = derivees_numeriques( self.f , 'numdifftools' )
+            else:
+                gradient = self.differences.gradient
+        self.df = MemoireDernierPoint( gradient )
+        self.gradient = gradient
+        if hessp is not None :
+            self.hessp = hessp
+            if hess is None :
+                hess = lambda x : np.column_stack([ hessp( x , e ) for e in np.eye( len( x ) ) ])
+        elif hess is not None or d2f_numdifftools is not None :
+            self.hessp = lambda x , p : self.d2f( x ) @ p
+        else:
+            self.hessp = self.hessp_differences
+        if hess is None :
+            hess = d2f_numdifftools or ( lambda x : self.differences.hessienne( x , gradient ) )
+        self.d2f = MemoireDernierPoint( hess )
+
+    def hessp_differences( self , x , p ) :
+        # Différences du gradient dans la direction p ; le gradient en x est pris dans la mémoire de df.
+        g0 = self.df( x ) if self.differences.methode == 'forward' else None
+        return self.differences.hessp( x , p , self.gradient , g0 )
+
+    @property
+    def nfev( self ) :
+        return ( self.fg.nfev if self.fg is not None else self.f.nfev ) + self.differences.nfev
+
+    @property
+    def njev( self ) :
+        return self.df.nfev
 
 #=================================================\\Gradient methods//===============================================
 
@@ -37,16 +143,12 @@ def Quasi_Newton( x0 , f , tol = 1e-3 ) :
      -------
      x : float
         Le résultat de l'optimisation.
-     List_sol_iteration : list
-                            liste des solution
 
 
     """
   
     h=1e-2
-    List_sol_iteration = [ ]
     while True:
-        List_sol_iteration.append( x0 )
         f0 = f( x0 )
         f1 = f( x0 - h )
         f2 = f( x0 + h )
@@ -56,7 +158,7 @@ def Quasi_Newton( x0 , f , tol = 1e-3 ) :
             return x 
         
 
-def methode_gradient( x0 , f , tol =1e-3 ):
+def methode_gradient( x0 , f , tol =1e-3 , historique = None , jac = None , differences = 'central' ):
     """ Minimisation de la fonction scalaire d'une ou plusieurs variable.
     
 
@@ -72,39 +174,47 @@ def methode_gradient( x0 , f , tol =1e-3 ):
             x`` is an 1-D array with shape (n,)
     tol : float, optional
          Tolérance pour la terminaison. The default is 1e-3.
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+    jac : callable or bool, optional
+         Le gradient de ``f``, ``jac( x ) -> ndarray, shape (n,)``. Si True, ``f`` retourne le couple
+         ``( f( x ) , gradient )`` calculé en une seule évaluation. The default is None (différences finies).
+    differences : str or DifferencesFinies, optional
+         Différences finies utilisées pour les dérivées non fournies : ``'forward'``, ``'central'``,
+         ``'complex'``, ``'numdifftools'`` ou un ``DifferencesFinies``. The default is 'central'.
 
     Returns
     -------
-     x : ndarray, shape (n,)
-        Le résultat de l'optimisation.
-     List_sol_iteration : list
-                           liste des solution
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
     """
-    df = nd.Gradient( f )
+    D = Derivees( f , jac , differences = differences )
+    f , df = D.f , D.df
+    H = historique_depuis( historique )
     grad = df( x0 )
-    print(grad)
-    g = lambda x , y : f( x - y * df( x ))
-    List_sol_iteration = [ ]
     while True:
-        List_sol_iteration.append( x0)
-        g1 = lambda y : g( x0 , y )
+        H.ajouter( x0)
+        # Le gradient au point courant est déjà connu : la recherche linéaire n'évalue que f.
+        g1 = lambda y : f( x0 - y * grad )
         y = Quasi_Newton( 0 , g1 ) 
-        print(y)
 
         x = x0 - y * grad
         grad = df( x )
 
         if np.linalg.norm( grad ) <= tol or  np.linalg.norm( x-x0 ) <= tol :
-           return x , List_sol_iteration
+           return ResultatOptimisation( x , f( x ) , H.n , D.nfev , D.njev , historique = H.valeurs() )
         x0 = x
         
 
 # 2.Conjugate Gradient:
 
-def gradient_conjugue( x0 , f ):
+def gradient_conjugue( x0 , f , historique = None , jac = None , hess = None , hessp = None , differences = 'central' ):
     """ Minimisation de la fonction scalaire d'une ou plusieurs variable.
     
+    Exactement n pas de gradient conjugué avec le pas optimal d'une quadratique ; pour une fonction
+    non quadratique, voir ``gradient_conjugue_non_lineaire``.
 
     Parameters
     ----------
@@ -116,52 +226,150 @@ def gradient_conjugue( x0 , f ):
           ``f( x ) -> float``
           
             x`` is an 1-D array with shape (n,)
-    
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+    jac : callable or bool, optional
+         Le gradient de ``f``, ``jac( x ) -> ndarray, shape (n,)``. Si True, ``f`` retourne le couple
+         ``( f( x ) , gradient )`` calculé en une seule évaluation. The default is None (différences finies).
+    hess : callable, optional
+         La matrice hessienne de ``f``, ``hess( x ) -> ndarray, shape (n, n)``. The default is None.
+    hessp : callable, optional
+         Le produit de la hessienne par un vecteur, ``hessp( x , p ) -> ndarray, shape (n,)``.
+         The default is None.
+    differences : str or DifferencesFinies, optional
+         Différences finies utilisées pour les dérivées non fournies : ``'forward'``, ``'central'``,
+         ``'complex'``, ``'numdifftools'`` ou un ``DifferencesFinies``. The default is 'central'.
+
 
     Returns
     -------
-     res : ndarray, shape (n,)
-        Le résultat de l'optimisation.
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
     """
-    List = [ ]
-    df=nd.Gradient( f )
-    d2f=nd.Hessian( f )
+    D = Derivees( f , jac , hess , hessp , differences )
+    f , df , hessp = D.f , D.df , D.hessp
+    H = historique_depuis( historique )
     d0=-df(x0)
     n=len(x0)
-    hess=d2f(x0)
     for k in range(n):
-        List += [ x0 ]
+        H.ajouter( x0 )
         Td0 = d0.T
-        a = ( Td0 @ d0 )/( Td0 @ hess @ d0 )
+        a = ( Td0 @ d0 )/( Td0 @ hessp( x0 , d0 ) )
         x0 = x0 + a * d0
         grd = df(x0)
-        hess = d2f(x0)
-        b =( grd.T @ hess @ d0 ) / ( Td0 @ hess @ d0 )
+        Hd0 = hessp( x0 , d0 )
+        b =( grd.T @ Hd0 ) / ( Td0 @ Hd0 )
         d0 = -grd + b * d0
     res = x0
    
-    return  res , List
+    return  ResultatOptimisation( res , f( res ) , H.n , D.nfev , D.njev , historique = H.valeurs() )
+
+# 3.Nonlinear Conjugate Gradient:
+
+def gradient_conjugue_non_lineaire( x0 , f , tol = 1e-3 , formule = 'PR+' , redemarrage = None , maxiter = None ,
+                                    jac = None , differences = 'central' , historique = None ):
+    """ Minimisation de la fonction scalaire d'une ou plusieurs variable par le gradient conjugué non linéaire.
+
+    Seul le gradient est utilisé : chaque itération coûte O( n ) opérations plus une recherche linéaire
+    de Wolfe (quelques évaluations de f et du gradient).
+
+    Parameters
+    ----------
+    x0 : ndarray, shape (n,)
+        Point initiale.
+    f : callable
+         La fonction objective à minimiser.
+       
+          ``f( x ) -> float``
+          
+            x`` is an 1-D array with shape (n,)
+    tol : float, optional
+         Tolérance sur la norme du gradient pour la terminaison. The default is 1e-3.
+    formule : str, optional
+         Calcul de beta : ``'FR'`` (Fletcher-Reeves), ``'PR+'`` (Polak-Ribière tronqué à 0) ou ``'HZ'``
+         (Hager-Zhang). The default is 'PR+'.
+    redemarrage : int, optional
+         Nombre d'itérations entre deux redémarrages sur la plus forte pente. The default is None (n).
+    maxiter : int, optional
+         Nombre maximal d'itérations. The default is None (200 n).
+    jac : callable or bool, optional
+         Le gradient de ``f``, ``jac( x ) -> ndarray, shape (n,)``. Si True, ``f`` retourne le couple
+         ``( f( x ) , gradient )`` calculé en une seule évaluation. The default is None (différences finies).
+    differences : str or DifferencesFinies, optional
+         Différences finies utilisées pour les dérivées non fournies : ``'forward'``, ``'central'``,
+         ``'complex'``, ``'numdifftools'`` ou un ``DifferencesFinies``. The default is 'central'.
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+
+    Returns
+    -------
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
+
+    """
+    if formule not in ( 'FR' , 'PR+' , 'HZ' ) :
+        raise ValueError( "formule inconnue : %r" % ( formule , ) )
+    D = Derivees( f , jac , differences = differences )
+    f , df = D.f , D.df
+    x0 = np.array( x0 , dtype = float )
+    n = len( x0 )
+    redemarrage = n if redemarrage is None else redemarrage
+    maxiter = 200 * n if maxiter is None else maxiter
+    H = historique_depuis( historique )
+    H.ajouter( x0 )
+    fx = f( x0 )
+    grad = df( x0 )
+    gg = grad @ grad
+    d = -grad
+    alpha = min( 1.0 , 1 / np.abs( grad ).max( initial = 1.0 ) )
+    pente = -gg
+    nit = 0
+    status , message = 0 , "Optimisation terminée avec succès."
+    while m.sqrt( gg ) > tol :
+        if nit == maxiter :
+            status , message = 1 , "Nombre maximal d'itérations atteint."
+            break
+        phi = lambda a : f( x0 + a * d )
+        dphi = lambda a : df( x0 + a * d ) @ d
+        alpha = wolfe( phi , dphi , fx , pente , alpha , c2 = 0.1 )
+        x0 = x0 + alpha * d
+        fx = f( x0 )
+        grad_nouveau = df( x0 )
+        nit = nit + 1
+        H.ajouter( x0 )
+        gg_nouveau = grad_nouveau @ grad_nouveau
+        if nit % redemarrage == 0 :
+            beta = 0.0
+        elif formule == 'FR' :
+            beta = gg_nouveau / gg
+        elif formule == 'PR+' :
+            beta = max( 0.0 , ( gg_nouveau - grad_nouveau @ grad ) / gg )
+        else:
+            y = grad_nouveau - grad
+            dy = d @ y
+            beta = ( y @ grad_nouveau - 2 * ( y @ y ) * ( d @ grad_nouveau ) / dy ) / dy
+            beta = max( beta , -1 / ( m.sqrt( d @ d ) * min( 0.01 , m.sqrt( gg ) ) ) )
+        d_nouveau = -grad_nouveau + beta * d
+        pente_nouvelle = grad_nouveau @ d_nouveau
+        if pente_nouvelle >= 0 :
+            d_nouveau = -grad_nouveau
+            pente_nouvelle = -gg_nouveau
+        # Premier pas de la recherche suivante : même décroissance du premier ordre qu'au pas précédent.
+        if pente_nouvelle < 0 :
+            alpha = alpha * pente / pente_nouvelle
+        d , grad , gg , pente = d_nouveau , grad_nouveau , gg_nouveau , pente_nouvelle
+    res = x0
+    return ResultatOptimisation( res , fx , nit , D.nfev , D.njev , status , message , historique = H.valeurs() )
 
 #==================================================\\Newton methods//================================================
 
 # 1.Newton Method:
 
-def determinant_sous_matrice( A , N ) :
-    SA = np.zeros(( N , N ))
-    for i in range(0,N):
-            for j in range(0,N):
-                SA[ i ][ j ] = A[ i ][ j ]
-    return np.linalg.det( SA ) 
-
-def define_positif( A ) :
-    N = len( A )
-    for n in range(1,N+1):
-        if determinant_sous_matrice( A , n ) <= 0 :
-            return False
-    return True
-
-def methode_Newton( x0 , f , tol = 1e-3 ):
+def methode_Newton( x0 , f , tol = 1e-3 , jac = None , hess = None , hessp = None , differences = 'central' ,
+                    reutilisation = 1 , maxiter = None , historique = None ):
     """ Minimisation de la fonction scalaire d'une ou plusieurs variable.
     
 
@@ -177,35 +385,69 @@ def methode_Newton( x0 , f , tol = 1e-3 ):
             x`` is an 1-D array with shape (n,)
     tol : float, optional
          Tolérance pour la terminaison. The default is 1e-3.
+    jac : callable or bool, optional
+         Le gradient de ``f``, ``jac( x ) -> ndarray, shape (n,)``. Si True, ``f`` retourne le couple
+         ``( f( x ) , gradient )`` calculé en une seule évaluation. The default is None (différences finies).
+    hess : callable, optional
+         La matrice hessienne de ``f``, ``hess( x ) -> ndarray, shape (n, n)``. The default is None.
+    hessp : callable, optional
+         Le produit de la hessienne par un vecteur, ``hessp( x , p ) -> ndarray, shape (n,)``.
+         The default is None.
+    differences : str or DifferencesFinies, optional
+         Différences finies utilisées pour les dérivées non fournies : ``'forward'``, ``'central'``,
+         ``'complex'``, ``'numdifftools'`` ou un ``DifferencesFinies``. The default is 'central'.
+    reutilisation : int, optional
+         Nombre d'itérations pendant lesquelles la hessienne factorisée est réutilisée : 1 pour la méthode
+         de Newton, plus pour la variante de Shamanskii, None pour la méthode de la corde (une seule
+         factorisation). The default is 1.
+    maxiter : int, optional
+         Nombre maximal d'itérations de Newton. The default is None (200 n).
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
 
     Returns
     -------
-     res : ndarray, shape (n,)
-        Le résultat de l'optimisation.
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
     """
-    
-    df = nd.Gradient( f )
-    d2f = nd.Hessian( f )
-    n = len( x0 )
-    d0 = -np.linalg.inv( d2f( x0 ) ) @ df( x0 )
-    g = lambda x , y :  f( x + y * np.linalg.inv( d2f( x0 ) ) @ df( x ) )
-
-    while np.linalg.norm( d0 ) > tol :
-
-        g1 = lambda y : g( x0 , y )
-        y = Quasi_Newton( 0 , g1 ) 
-        x = x0 - y * d0;
-        hess = d2f( x )
-        if define_positif( hess )==True:
-          d0 = -np.linalg.inv( hess ) @ df( x )
-        else:
-            va,ve = np.linalg.eig( d2f(x0) )
-            eps = min ( va )
-            d0 = -np.linalg.inv( eps * np.eye( n ) @ hess ) @ df( x )
-        x0 = x 
-    res = x0
-    return res 
+    if reutilisation is not None and ( int( reutilisation ) != reutilisation or reutilisation < 1 ) :
+        raise ValueError( "reutilisation doit être un entier au moins égal à 1, ou None" )
+    D = Derivees( f , jac , hess , hessp , differences )
+    f , df , d2f = D.f , D.df , D.d2f
+    x0 = np.asarray( x0 , dtype = float )
+    maxiter = 200 * len( x0 ) if maxiter is None else maxiter
+    H = historique_depuis( historique )
+    H.ajouter( x0 )
+    fx = f( x0 )
+    grad = df( x0 )
+    k = 0
+    status , message = 0 , "Optimisation terminée avec succès."
+    while True :
+        if k == 0 or reutilisation is not None and k % reutilisation == 0 :
+            # Une hessienne et une factorisation par itération ; un décalage de Levenberg
+            # la rend définie positive si besoin, la direction est alors toujours de descente.
+            L , tau = Choleski_modifie( d2f( x0 ) )
+        d0 = -resoudre_Choleski( L , grad )
+        if np.linalg.norm( d0 ) <= tol :
+            break
+        if k == maxiter :
+            status , message = 1 , "Nombre maximal d'itérations atteint."
+            break
+        # Recherche linéaire par rebroussement à partir du pas de Newton.
+        pente = grad @ d0
+        y = 1.0
+        fy = f( x0 + y * d0 )
+        while fy > fx + 1e-4 * y * pente and y > 1e-10 :
+            y = y / 2
+            fy = f( x0 + y * d0 )
+        x0 = x0 + y * d0
+        fx = fy
+        grad = df( x0 )
+        k = k + 1
+        H.ajouter( x0 )
+    return ResultatOptimisation( x0 , fx , k , D.nfev , D.njev , status , message , historique = H.valeurs() )
 
 
 
@@ -214,7 +456,9 @@ def methode_Newton( x0 , f , tol = 1e-3 ):
 def armijo(phi,alpha0,ita,epsilon,d,grad):
     
     
-    approximation = lambda alpha : phi(0)+ epsilon* (d.T @ grad) * alpha
+    phi0 = phi( 0 )
+    pente = d.T @ grad
+    approximation = lambda alpha : phi0+ epsilon* pente * alpha
 
     alpha=alpha0 
     if  phi( alpha )<approximation(alpha) :
@@ -226,21 +470,174 @@ def armijo(phi,alpha0,ita,epsilon,d,grad):
     
     else :
        while phi( alpha ) >= approximation(alpha) :
-            ancienne_v =alpha
             alpha= alpha/ita           
-       return ancienne_v
+       return alpha
+
+# 3.Strong Wolfe line search:
+
+def interpolation_cubique( a , fa , ga , b , fb , gb ):
+    # Minimum de la cubique qui interpole f et f' en a et b, ramené à l'intérieur de [ a , b ].
+    gauche , droite = min( a , b ) , max( a , b )
+    marge = 0.1 * ( droite - gauche )
+    d1 = ga + gb - 3 * ( fa - fb ) / ( a - b )
+    disc = d1 * d1 - ga * gb
+    if disc >= 0 :
+        d2 = np.copysign( m.sqrt( disc ) , b - a )
+        den = gb - ga + 2 * d2
+        if den != 0 :
+            x = b - ( b - a ) * ( gb + d2 - d1 ) / den
+            if gauche + marge <= x <= droite - marge :
+                return x
+    return ( a + b ) / 2
+
+def wolfe( phi , dphi , phi0 , dphi0 , alpha1 = 1.0 , c1 = 1e-4 , c2 = 0.9 , maxiter = 30 ):
+    """ Recherche linéaire vérifiant les conditions fortes de Wolfe.
+
+    Parameters
+    ----------
+    phi : callable
+        ``phi( alpha ) = f( x + alpha d )``.
+    dphi : callable
+        ``dphi( alpha ) = df( x + alpha d ) @ d``.
+    phi0 , dphi0 : float
+        ``phi( 0 )`` et ``dphi( 0 )`` ( < 0 ).
+    alpha1 : float, optional
+        Premier pas essayé. The default is 1.
+    c1 , c2 : float, optional
+        Constantes de décroissance suffisante et de courbure. The default is 1e-4 and 0.9.
+    maxiter : int, optional
+        Nombre maximal d'essais. The default is 30.
+
+    Returns
+    -------
+    alpha : float
+        Le pas trouvé (le meilleur essai si ``maxiter`` est atteint).
+
+    """
+    def zoom( lo , f_lo , g_lo , hi , f_hi , g_hi ):
+        for i in range(0,maxiter):
+            a = interpolation_cubique( lo , f_lo , g_lo , hi , f_hi , g_hi )
+            fa = phi( a )
+            ga = dphi( a )
+            if fa > phi0 + c1 * a * dphi0 or fa >= f_lo :
+                hi , f_hi , g_hi = a , fa , ga
+            else:
+                if abs( ga ) <= -c2 * dphi0 :
+                    return a
+                if ga * ( hi - lo ) >= 0 :
+                    hi , f_hi , g_hi = lo , f_lo , g_lo
+                lo , f_lo , g_lo = a , fa , ga
+        return lo
+
+    a_prec , f_prec , g_prec = 0.0 , phi0 , dphi0
+    a = alpha1
+    for i in range(0,maxiter):
+        fa = phi( a )
+        ga = dphi( a )
+        if fa > phi0 + c1 * a * dphi0 or ( i > 0 and fa >= f_prec ) :
+            return zoom( a_prec , f_prec , g_prec , a , fa , ga )
+        if abs( ga ) <= -c2 * dphi0 :
+            return a
+        if ga >= 0 :
+            return zoom( a , fa , ga , a_prec , f_prec , g_prec )
+        a_prec , f_prec , g_prec = a , fa , ga
+        a = 2 * a
+    return a_prec
+
+# 4.Davidon Fletcher Powell & BFGS updates:
+
+def Davidon_Fletcher_Powell( H , d , y , alpha , tampon = None ):
+   """ Mise à jour DFP de l'approximation H de l'inverse de la hessienne, faite sur place.
+
+   ``H + s s.T / ( s.T y ) - ( H y ) ( H y ).T / ( y.T H y )`` avec ``s = alpha d`` ; ``tampon`` est un
+   tableau (n, n) réutilisé pour les produits extérieurs.
+
+   """
+   s = alpha * d
+   Hy = H @ y
+   tampon = np.empty_like( H ) if tampon is None else tampon
+   H += np.multiply.outer( s , s / ( s @ y ) , out = tampon )
+   H -= np.multiply.outer( Hy , Hy / ( y @ Hy ) , out = tampon )
+   return H
+
+def BFGS( H , s , y , tampon = None ):
+   """ Mise à jour BFGS de l'approximation H de l'inverse de la hessienne, faite sur place.
+
+   ``( I - rho s y.T ) H ( I - rho y s.T ) + rho s s.T`` avec ``rho = 1 / ( y.T s )``, écrite comme
+   deux mises à jour de rang un ``s u.T + u s.T`` ; ``tampon`` est un tableau (n, n) réutilisé.
+
+   """
+   rho = 1 / ( y @ s )
+   Hy = H @ y
+   u = ( ( rho * rho * ( y @ Hy ) + rho ) / 2 ) * s - rho * Hy
+   tampon = np.empty_like( H ) if tampon is None else tampon
+   H += np.multiply.outer( s , u , out = tampon )
+   H += np.multiply.outer( u , s , out = tampon )
+   return H
+
+# 5.Limited-memory BFGS:
+
+class MemoireLBFGS :
+    """
+    Les m dernières paires ( s , y ) de la méthode L-BFGS, rangées dans des tableaux préalloués
+    utilisés comme tampons circulaires : la mémoire et le coût d'une direction sont en O( m n ).
+
+    Parameters
+    ----------
+    n : int
+        Dimension du problème.
+    m : int, optional
+        Nombre de paires gardées. The default is 10.
+
+    """
+
+    def __init__( self , n , m = 10 ) :
+        self.m = m
+        self.S = np.zeros(( m , n ))
+        self.Y = np.zeros(( m , n ))
+        self.rho = np.zeros( m )
+        self.alpha = np.zeros( m )
+        self.k = 0
+
+    def ajouter( self , s , y ) :
+        sy = s @ y
+        # Une paire sans courbure positive rendrait l'approximation non définie positive : elle est ignorée.
+        if sy <= 1e-10 * np.linalg.norm( s ) * np.linalg.norm( y ) :
+            return False
+        j = self.k % self.m
+        self.S[ j ] = s
+        self.Y[ j ] = y
+        self.rho[ j ] = 1 / sy
+        self.k += 1
+        return True
+
+    def vider( self ) :
+        self.k = 0
 
-# 3.Davidon Fletcher Powell
+    def direction( self , grad ) :
+        """
+        Calculer ``-H grad`` par la double boucle de L-BFGS.
 
-def Davidon_Fletcher_Powell( H , d , y , alpha ):
-   A= (alpha* (d @ d.T) )/ (d.T @ y )
-   B= - ( H @ y ) @ (( H @ y ).T) / ( y.T @ H @ y )
-   return H + A + B
+        """
+        q = np.array( grad , dtype = float )
+        nb = min( self.k , self.m )
+        ordre = [ ( self.k - 1 - i ) % self.m for i in range(0,nb) ]
+        for j in ordre :
+            self.alpha[ j ] = self.rho[ j ] * ( self.S[ j ] @ q )
+            q -= self.alpha[ j ] * self.Y[ j ]
+        if nb :
+            j = ordre[ 0 ]
+            q *= ( self.S[ j ] @ self.Y[ j ] ) / ( self.Y[ j ] @ self.Y[ j ] )
+        for j in reversed( ordre ) :
+            beta = self.rho[ j ] * ( self.Y[ j ] @ q )
+            q += ( self.alpha[ j ] - beta ) * self.S[ j ]
+        return -q
 
-# 4.Quasi-Newton with DFP and armijo:
+# 6.Quasi-Newton with DFP and armijo:
 
 
-def Quasi_Newton_and_armijo( x0 , f ,tol = 1e-3 ):
+def Quasi_Newton_and_armijo( x0 , f ,tol = 1e-3 , historique = None , jac = None , differences = 'central' ,
+                             mise_a_jour = 'DFP' , m = 10 , recherche = 'armijo' ):
   """ Minimisation de la fonction scalaire d'une ou plusieurs variable.
     
 
@@ -256,33 +653,419 @@ def Quasi_Newton_and_armijo( x0 , f ,tol = 1e-3 ):
             x`` is an 1-D array with shape (n,)
     tol : float, optional
          Tolérance pour la terminaison. The default is 1e-3.
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+    jac : callable or bool, optional
+         Le gradient de ``f``, ``jac( x ) -> ndarray, shape (n,)``. Si True, ``f`` retourne le couple
+         ``( f( x ) , gradient )`` calculé en une seule évaluation. The default is None (différences finies).
+    differences : str or DifferencesFinies, optional
+         Différences finies utilisées pour les dérivées non fournies : ``'forward'``, ``'central'``,
+         ``'complex'``, ``'numdifftools'`` ou un ``DifferencesFinies``. The default is 'central'.
+    mise_a_jour : str, optional
+         ``'DFP'`` ou ``'BFGS'`` : approximation dense de l'inverse de la hessienne, mise à jour sur place
+         par Davidon-Fletcher-Powell ou par BFGS ; ``'LBFGS'`` : L-BFGS à mémoire limitée, en O( m n )
+         mémoire et opérations par itération. The default is 'DFP'.
+    m : int, optional
+         Nombre de paires ( s , y ) gardées par L-BFGS. The default is 10.
+    recherche : str, optional
+         Recherche linéaire : ``'armijo'`` ou ``'wolfe'`` (conditions fortes de Wolfe, interpolation cubique).
+         Avec BFGS, L-BFGS ou Wolfe, le premier pas essayé est le pas unité. The default is 'armijo'.
 
     Returns
     -------
-     res : ndarray, shape (n,)
-        Le résultat de l'optimisation.
-     List_sol_iteration : list
-                          liste des solution
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
   """
   ita=2
   alpha0 = tol 
   n = len( x0 ) 
-  df = nd.Gradient( f )
+  D = Derivees( f , jac , differences = differences )
+  f , df = D.f , D.df
   grad = df( x0 )
-  H = np.eye( n )
-  List_sol_iteration= [ x0 ]
+  lbfgs = mise_a_jour == 'LBFGS'
+  if lbfgs :
+     memoire = MemoireLBFGS( n , m )
+  else:
+     H = np.eye( n )
+     tampon = np.empty(( n , n ))
+  if mise_a_jour != 'DFP' or recherche == 'wolfe' :
+     alpha0 = 1.0
+  k = 0
+  historique = historique_depuis( historique )
+  historique.ajouter( x0 )
   while ( np.linalg.norm( grad ) > tol ):
-     d = - H @ grad
+     if lbfgs :
+        d = memoire.direction( grad )
+        if d @ grad >= 0 :
+           memoire.vider()
+           d = - grad
+     else:
+        d = - H @ grad
      phi= lambda alpha : f(x0+alpha*d)  
-     alpha_min  = armijo( phi , alpha0 , ita , tol , d , grad )
+     if recherche == 'wolfe' :
+        dphi = lambda alpha : df( x0 + alpha * d ) @ d
+        alpha_min = wolfe( phi , dphi , f( x0 ) , grad @ d , alpha0 )
+     else:
+        alpha_min  = armijo( phi , alpha0 , ita , tol , d , grad )
      x0 = x0 + alpha_min * d
-     List_sol_iteration.append( x0 )
+     historique.ajouter( x0 )
      y = - grad
      grad = df( x0 )  
      y = y + grad
-     H = Davidon_Fletcher_Powell( H , d , y , alpha_min )
+     s = alpha_min * d
+     if lbfgs :
+        memoire.ajouter( s , y )
+     elif s @ y > 1e-10 * np.linalg.norm( s ) * np.linalg.norm( y ) :
+        if mise_a_jour == 'BFGS' :
+           if k == 0 :
+              # Mise à l'échelle de H avant la première mise à jour.
+              H *= ( s @ y ) / ( y @ y )
+           BFGS( H , s , y , tampon )
+        else:
+           Davidon_Fletcher_Powell( H , d , y , alpha_min , tampon )
+        k = k + 1
   res = x0
-  return res , List_sol_iteration
+  return ResultatOptimisation( res , f( res ) , historique.n - 1 , D.nfev , D.njev , historique = historique.valeurs() )
+
+# 7.Truncated Newton (Newton-CG):
+
+def Newton_CG( x0 , f , tol = 1e-3 , jac = None , hess = None , hessp = None , differences = 'central' ,
+               maxiter = None , historique = None ):
+    """ Minimisation de la fonction scalaire d'une ou plusieurs variable par la méthode de Newton tronquée.
+
+    La direction de Newton est approchée par un gradient conjugué interne qui n'utilise que des produits
+    hessienne-vecteur : la mémoire est en O( n ). Le gradient conjugué s'arrête quand le résidu est assez
+    petit ( ``min( 0.5 , sqrt( |g| ) ) |g|`` ) ou dès qu'une direction de courbure négative apparaît.
+    Le pas est choisi par une recherche linéaire de Wolfe.
+
+    Parameters
+    ----------
+    x0 : ndarray, shape (n,)
+        Point initiale.
+    f : callable
+         La fonction objective à minimiser.
+       
+          ``f( x ) -> float``
+          
+            x`` is an 1-D array with shape (n,)
+    tol : float, optional
+         Tolérance sur la norme du gradient pour la terminaison. The default is 1e-3.
+    jac : callable or bool, optional
+         Le gradient de ``f``, ``jac( x ) -> ndarray, shape (n,)``. Si True, ``f`` retourne le couple
+         ``( f( x ) , gradient )`` calculé en une seule évaluation. The default is None (différences finies).
+    hess : callable, optional
+         La matrice hessienne de ``f``, ``hess( x ) -> ndarray, shape (n, n)``. The default is None.
+    hessp : callable, optional
+         Le produit de la hessienne par un vecteur, ``hessp( x , p ) -> ndarray, shape (n,)``. S'il n'est
+         pas donné (ni ``hess``), il est obtenu par différences du gradient. The default is None.
+    differences : str or DifferencesFinies, optional
+         Différences finies utilisées pour les dérivées non fournies : ``'forward'``, ``'central'``,
+         ``'complex'``, ``'numdifftools'`` ou un ``DifferencesFinies``. The default is 'central'.
+    maxiter : int, optional
+         Nombre maximal d'itérations de Newton. The default is None (200 n).
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+
+    Returns
+    -------
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
+
+    """
+    D = Derivees( f , jac , hess , hessp , differences )
+    f , df , hessp = D.f , D.df , D.hessp
+    x0 = np.array( x0 , dtype = float )
+    n = len( x0 )
+    maxiter = 200 * n if maxiter is None else maxiter
+    H = historique_depuis( historique )
+    H.ajouter( x0 )
+    grad = df( x0 )
+    fx = f( x0 )
+    nit = 0
+    status , message = 0 , "Optimisation terminée avec succès."
+    while np.linalg.norm( grad ) > tol :
+        if nit == maxiter :
+            status , message = 1 , "Nombre maximal d'itérations atteint."
+            break
+        # Gradient conjugué interne sur hess @ z = -grad.
+        norme_g = np.linalg.norm( grad )
+        eta = min( 0.5 , m.sqrt( norme_g ) ) * norme_g
+        z = np.zeros( n )
+        r = grad.copy()
+        p = -r
+        rr = r @ r
+        for i in range(0,10*n):
+            Hp = hessp( x0 , p )
+            courbure = p @ Hp
+            if courbure <= 0 :
+                # Courbure négative : on garde l'itéré courant, ou la plus forte pente au premier pas.
+                if i == 0 :
+                    z = -grad
+                break
+            a = rr / courbure
+            z += a * p
+            r += a * Hp
+            rr_nouveau = r @ r
+            if m.sqrt( rr_nouveau ) <= eta :
+                break
+            p = -r + ( rr_nouveau / rr ) * p
+            rr = rr_nouveau
+        pente = grad @ z
+        if pente >= 0 :
+            z = -grad
+            pente = -norme_g ** 2
+        phi = lambda alpha : f( x0 + alpha * z )
+        dphi = lambda alpha : df( x0 + alpha * z ) @ z
+        alpha = wolfe( phi , dphi , fx , pente )
+        x0 = x0 + alpha * z
+        fx = f( x0 )
+        grad = df( x0 )
+        nit = nit + 1
+        H.ajouter( x0 )
+    res = x0
+    return ResultatOptimisation( res , fx , nit , D.nfev , D.njev , status , message , historique = H.valeurs() )
+
+#================================================\\Stochastic methods//==============================================
+
+# 1.Learning-rate schedules:
+
+def calendrier_exponentiel( pas0 , gamma , tous = 1 ):
+    """ Pas ``pas0 * gamma ** ( k // tous )`` à l'itération k. """
+    return lambda k : pas0 * gamma ** ( k // tous )
+
+def calendrier_inverse( pas0 , k0 ):
+    """ Pas ``pas0 / ( 1 + k / k0 )`` à l'itération k. """
+    return lambda k : pas0 / ( 1 + k / k0 )
+
+def calendrier_cosinus( pas0 , K , pas_min = 0.0 ):
+    """ Pas décroissant de ``pas0`` à ``pas_min`` en demi-cosinus sur K itérations, puis constant. """
+    return lambda k : pas_min + ( pas0 - pas_min ) * ( 1 + m.cos( m.pi * min( k , K ) / K ) ) / 2
+
+# 2.Stochastic gradient engine:
+
+def iterer_lots( lots , epoques ):
+    # Un callable donne un nouvel itérable à chaque époque (flux relu depuis le disque, générateur...) ;
+    # sinon l'itérable est reparcouru, ce qui n'est possible qu'une fois pour un générateur.
+    for e in range(0,epoques):
+        yield from ( lots() if callable( lots ) else lots )
+
+def gradient_stochastique( x0 , grad , lots , pas , etape , epoques = 1 , historique = None ):
+    """ Boucle commune des méthodes stochastiques.
+
+    ``etape( x , g , pas , k )`` met ``x`` à jour sur place à partir du gradient ``g`` du lot courant ;
+    ``pas`` est un nombre ou un calendrier ``pas( k ) -> float``.
+
+    """
+    x = np.array( x0 , dtype = float )
+    H = historique_depuis( historique )
+    calendrier = pas if callable( pas ) else None
+    k = 0
+    for lot in iterer_lots( lots , epoques ) :
+        g = np.asarray( grad( x , lot ) , dtype = float )
+        etape( x , g , calendrier( k ) if calendrier else pas , k )
+        k = k + 1
+        H.ajouter( x )
+    return ResultatOptimisation( x , None , k , 0 , k , historique = H.valeurs() )
+
+# 3.SGD with momentum:
+
+def SGD( x0 , grad , lots , pas = 0.01 , momentum = 0.0 , nesterov = False , epoques = 1 , historique = None ):
+    """ Descente de gradient stochastique, avec moment (classique ou de Nesterov).
+
+    Parameters
+    ----------
+    x0 : ndarray, shape (n,)
+        Point initiale.
+    grad : callable
+         Le gradient de la fonction objective sur un lot de données.
+
+          ``grad( x , lot ) -> ndarray, shape (n,)``
+
+    lots : iterable or callable
+         Les lots de données, parcourus une fois par époque ; un callable sans argument donne un nouvel
+         itérable (par exemple un générateur qui lit un fichier par morceaux) à chaque époque.
+    pas : float or callable, optional
+         Le pas d'apprentissage, ou un calendrier ``pas( k ) -> float``. The default is 0.01.
+    momentum : float, optional
+         Coefficient du moment. The default is 0.
+    nesterov : bool, optional
+         Utiliser le moment de Nesterov. The default is False.
+    epoques : int, optional
+         Nombre de passages sur les lots. The default is 1.
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+
+    Returns
+    -------
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``nit`` et ``njev`` comptent les lots traités.
+
+    """
+    v = np.zeros( len( x0 ) )
+    t = np.empty( len( x0 ) )
+    def etape( x , g , pas , k ):
+        if momentum :
+            np.multiply( v , momentum , out = v )
+            np.subtract( v , np.multiply( g , pas , out = t ) , out = v )
+            if nesterov :
+                x += np.multiply( v , momentum , out = t )
+                x -= np.multiply( g , pas , out = t )
+            else:
+                x += v
+        else:
+            x -= np.multiply( g , pas , out = t )
+    return gradient_stochastique( x0 , grad , lots , pas , etape , epoques , historique )
+
+# 4.AdaGrad:
+
+def AdaGrad( x0 , grad , lots , pas = 0.01 , eps = 1e-8 , epoques = 1 , historique = None ):
+    """ AdaGrad : le pas de chaque paramètre est divisé par la racine de la somme des carrés de ses gradients.
+
+    Parameters
+    ----------
+    x0 : ndarray, shape (n,)
+        Point initiale.
+    grad : callable
+         Le gradient de la fonction objective sur un lot de données.
+
+          ``grad( x , lot ) -> ndarray, shape (n,)``
+
+    lots : iterable or callable
+         Les lots de données, parcourus une fois par époque ; un callable sans argument donne un nouvel
+         itérable à chaque époque.
+    pas : float or callable, optional
+         Le pas d'apprentissage, ou un calendrier ``pas( k ) -> float``. The default is 0.01.
+    eps : float, optional
+         Terme de stabilité numérique. The default is 1e-8.
+    epoques : int, optional
+         Nombre de passages sur les lots. The default is 1.
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+
+    Returns
+    -------
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``nit`` et ``njev`` comptent les lots traités.
+
+    """
+    G = np.zeros( len( x0 ) )
+    t = np.empty( len( x0 ) )
+    def etape( x , g , pas , k ):
+        np.add( G , np.multiply( g , g , out = t ) , out = G )
+        np.sqrt( G , out = t )
+        np.add( t , eps , out = t )
+        np.divide( g , t , out = t )
+        np.multiply( t , pas , out = t )
+        x -= t
+    return gradient_stochastique( x0 , grad , lots , pas , etape , epoques , historique )
+
+# 5.RMSProp:
+
+def RMSProp( x0 , grad , lots , pas = 1e-3 , rho = 0.9 , eps = 1e-8 , epoques = 1 , historique = None ):
+    """ RMSProp : le pas est divisé par la racine d'une moyenne glissante des carrés des gradients.
+
+    Parameters
+    ----------
+    x0 : ndarray, shape (n,)
+        Point initiale.
+    grad : callable
+         Le gradient de la fonction objective sur un lot de données.
+
+          ``grad( x , lot ) -> ndarray, shape (n,)``
+
+    lots : iterable or callable
+         Les lots de données, parcourus une fois par époque ; un callable sans argument donne un nouvel
+         itérable à chaque époque.
+    pas : float or callable, optional
+         Le pas d'apprentissage, ou un calendrier ``pas( k ) -> float``. The default is 1e-3.
+    rho : float, optional
+         Coefficient de la moyenne glissante. The default is 0.9.
+    eps : float, optional
+         Terme de stabilité numérique. The default is 1e-8.
+    epoques : int, optional
+         Nombre de passages sur les lots. The default is 1.
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+
+    Returns
+    -------
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``nit`` et ``njev`` comptent les lots traités.
+
+    """
+    E = np.zeros( len( x0 ) )
+    t = np.empty( len( x0 ) )
+    def etape( x , g , pas , k ):
+        np.multiply( E , rho , out = E )
+        np.multiply( g , g , out = t )
+        np.multiply( t , 1 - rho , out = t )
+        np.add( E , t , out = E )
+        np.sqrt( E , out = t )
+        np.add( t , eps , out = t )
+        np.divide( g , t , out = t )
+        np.multiply( t , pas , out = t )
+        x -= t
+    return gradient_stochastique( x0 , grad , lots , pas , etape , epoques , historique )
+
+# 6.Adam:
+
+def Adam( x0 , grad , lots , pas = 1e-3 , beta1 = 0.9 , beta2 = 0.999 , eps = 1e-8 , epoques = 1 , historique = None ):
+    """ Adam : moyennes glissantes du gradient et de son carré, corrigées de leur biais initial.
+
+    Parameters
+    ----------
+    x0 : ndarray, shape (n,)
+        Point initiale.
+    grad : callable
+         Le gradient de la fonction objective sur un lot de données.
+
+          ``grad( x , lot ) -> ndarray, shape (n,)``
+
+    lots : iterable or callable
+         Les lots de données, parcourus une fois par époque ; un callable sans argument donne un nouvel
+         itérable à chaque époque.
+    pas : float or callable, optional
+         Le pas d'apprentissage, ou un calendrier ``pas( k ) -> float``. The default is 1e-3.
+    beta1 , beta2 : float, optional
+         Coefficients des moyennes glissantes. The default is 0.9 and 0.999.
+    eps : float, optional
+         Terme de stabilité numérique. The default is 1e-8.
+    epoques : int, optional
+         Nombre de passages sur les lots. The default is 1.
+    historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
+
+    Returns
+    -------
+     res : ResultatOptimisation
+        Le résultat de l'optimisation ; ``nit`` et ``njev`` comptent les lots traités.
+
+    """
+    M = np.zeros( len( x0 ) )
+    V = np.zeros( len( x0 ) )
+    t = np.empty( len( x0 ) )
+    def etape( x , g , pas , k ):
+        np.multiply( M , beta1 , out = M )
+        np.add( M , np.multiply( g , 1 - beta1 , out = t ) , out = M )
+        np.multiply( V , beta2 , out = V )
+        np.multiply( g , g , out = t )
+        np.multiply( t , 1 - beta2 , out = t )
+        np.add( V , t , out = V )
+        # La correction du biais des moments est reportée sur le pas et sur eps.
+        c2 = m.sqrt( 1 - beta2 ** ( k + 1 ) )
+        pas_k = pas * c2 / ( 1 - beta1 ** ( k + 1 ) )
+        np.sqrt( V , out = t )
+        np.add( t , eps * c2 , out = t )
+        np.divide( M , t , out = t )
+        np.multiply( t , pas_k , out = t )
+        x -= t
+    return gradient_stochastique( x0 , grad , lots , pas , etape , epoques , historique )
 
 #====================================================================================================================
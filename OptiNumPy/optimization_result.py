@@ -0,0 +1,218 @@
+#=================================================\\Documentation//==================================================
+
+"""
+This module contains the result object returned by the optimization methods of univariate_optimization and
+multivariate_optimization, and the bounded storage used to record their iteration history.
+
+"""
+
+#================================================\\Libraries needed//================================================
+
+import numpy as np
+
+#==================================================\\Iteration history//=============================================
+
+class Historique :
+    """
+    Enregistrement des itérés d'une méthode d'optimisation dans un tableau NumPy préalloué.
+
+    Parameters
+    ----------
+    mode : str, optional
+        ``'aucun'`` : rien n'est gardé, seules les itérations sont comptées ;
+        ``'tout'`` : tous les itérés sont gardés, le tableau doublant de taille quand il est plein ;
+        ``'derniers'`` : seuls les ``taille`` derniers itérés sont gardés (tampon circulaire) ;
+        ``'chaque'`` : un itéré sur ``taille`` est gardé.
+        The default is 'tout'.
+    taille : int, optional
+        Nombre d'itérés gardés en mode ``'derniers'``, pas d'échantillonnage en mode ``'chaque'``.
+        The default is 1.
+
+    Attributes
+    ----------
+    n : int
+        Nombre d'itérés proposés à ``ajouter``, gardés ou non.
+
+    """
+
+    __slots__ = ( 'mode' , 'taille' , 'n' , 'garde' , 'tableau' )
+
+    def __init__( self , mode = 'tout' , taille = 1 ) :
+        if mode not in ( 'aucun' , 'tout' , 'derniers' , 'chaque' ) :
+            raise ValueError( "mode d'historique inconnu : %r" % ( mode , ) )
+        if mode in ( 'derniers' , 'chaque' ) and taille < 1 :
+            raise ValueError( "la taille de l'historique doit être au moins 1" )
+        self.mode = mode
+        self.taille = taille
+        self.n = 0
+        self.garde = 0
+        self.tableau = None
+
+    def preparer( self , x , capacite ) :
+        x = np.asarray( x )
+        self.tableau = np.empty( ( capacite , ) + x.shape , dtype = np.result_type( x.dtype , float ) )
+
+    def ajouter( self , x ) :
+        n = self.n
+        self.n = n + 1
+        mode = self.mode
+        if mode == 'aucun' :
+            return
+        if mode == 'derniers' :
+            if self.tableau is None :
+                self.preparer( x , self.taille )
+            self.tableau[ n % self.taille ] = x
+            self.garde = min( self.garde + 1 , self.taille )
+            return
+        if mode == 'chaque' and n % self.taille :
+            return
+        if self.tableau is None :
+            self.preparer( x , 16 )
+        elif self.garde == len( self.tableau ) :
+            ancien = self.tableau
+            self.tableau = np.empty( ( 2 * len( ancien ) , ) + ancien.shape[ 1: ] , dtype = ancien.dtype )
+            self.tableau[ :len( ancien ) ] = ancien
+        self.tableau[ self.garde ] = x
+        self.garde += 1
+
+    def ajouter_bloc( self , X ) :
+        """
+        Ajouter d'un coup les itérés rangés dans les lignes de X.
+
+        """
+        X = np.asarray( X )
+        m = len( X )
+        if self.mode == 'aucun' or m == 0 :
+            self.n += m
+            return
+        if self.mode == 'derniers' :
+            debut = max( m - self.taille , 0 )
+            self.n += debut
+            self.garde = min( self.garde + debut , self.taille )
+            for x in X[ debut: ] :
+                self.ajouter( x )
+            return
+        if self.mode == 'chaque' :
+            X = X[ ( - self.n ) % self.taille :: self.taille ]
+        self.n += m
+        if len( X ) == 0 :
+            return
+        if self.tableau is None :
+            self.preparer( X[ 0 ] , max( 16 , len( X ) ) )
+        besoin = self.garde + len( X )
+        if besoin > len( self.tableau ) :
+            ancien = self.tableau
+            self.tableau = np.empty( ( max( besoin , 2 * len( ancien ) ) , ) + ancien.shape[ 1: ] , dtype = ancien.dtype )
+            self.tableau[ :self.garde ] = ancien[ :self.garde ]
+        self.tableau[ self.garde:besoin ] = X
+        self.garde = besoin
+
+    def valeurs( self ) :
+        """
+        Retourner les itérés gardés, du plus ancien au plus récent.
+
+        Returns
+        -------
+        H : ndarray
+            Tableau de forme ( m , ) + forme d'un itéré ; vide en mode ``'aucun'``.
+
+        """
+        if self.tableau is None :
+            return np.empty( 0 )
+        if self.mode == 'derniers' :
+            debut = self.n % self.taille if self.garde == self.taille else 0
+            return np.roll( self.tableau[ :self.garde ] , -debut , axis = 0 )
+        return self.tableau[ :self.garde ]
+
+    def __len__( self ) :
+        return self.garde
+
+def historique_depuis( historique ) :
+    """
+    Construire l'``Historique`` demandé par l'option ``historique`` des méthodes d'optimisation.
+
+    Parameters
+    ----------
+    historique : None, bool, tuple or Historique
+        None ou False : pas d'historique ; True : tous les itérés ;
+        ``( 'derniers' , k )`` : les k derniers itérés ; ``( 'chaque' , m )`` : un itéré sur m ;
+        un ``Historique`` est utilisé tel quel.
+
+    Returns
+    -------
+    H : Historique
+
+    """
+    if isinstance( historique , Historique ) :
+        return historique
+    if historique is None or historique is False :
+        return Historique( 'aucun' )
+    if historique is True :
+        return Historique( 'tout' )
+    mode , taille = historique
+    return Historique( mode , taille )
+
+#===================================================\\Result object//================================================
+
+class ResultatOptimisation :
+    """
+    Résultat d'une méthode d'optimisation.
+
+    Pour rester compatible avec les anciens retours ``res , List_sol_iteration``, l'objet se déballe
+    et s'indexe comme le couple ``( x , historique )``.
+
+    Attributes
+    ----------
+    x : float or ndarray
+        Le résultat de l'optimisation.
+    fun : float
+        Valeur de la fonction objective en ``x`` (None si la méthode ne l'a pas évaluée en ``x``).
+    nit : int
+        Nombre d'itérations.
+    nfev : int
+        Nombre d'évaluations de la fonction objective.
+    njev : int
+        Nombre d'évaluations de la dérivée ou du gradient.
+    nhits : int
+        Nombre de valeurs retrouvées dans le cache des évaluations au lieu d'être recalculées.
+    status : int
+        0 si la méthode s'est terminée normalement.
+    message : str
+        Description de la terminaison.
+    historique : ndarray
+        Les itérés gardés (vide si l'historique n'a pas été demandé).
+
+    """
+
+    __slots__ = ( 'x' , 'fun' , 'nit' , 'nfev' , 'njev' , 'nhits' , 'status' , 'message' , 'historique' )
+
+    def __init__( self , x , fun = None , nit = 0 , nfev = 0 , njev = 0 , status = 0 ,
+                  message = "Optimisation terminée avec succès." , historique = None , nhits = 0 ) :
+        self.x = x
+        self.fun = fun
+        self.nit = nit
+        self.nfev = nfev
+        self.njev = njev
+        self.nhits = nhits
+        self.status = status
+        self.message = message
+        self.historique = np.empty( 0 ) if historique is None else historique
+
+    @property
+    def success( self ) :
+        return self.status == 0
+
+    def __iter__( self ) :
+        yield self.x
+        yield self.historique
+
+    def __getitem__( self , i ) :
+        return ( self.x , self.historique )[ i ]
+
+    def __len__( self ) :
+        return 2
+
+    def __repr__( self ) :
+        return "\n".join( "%10s: %r" % ( nom , getattr( self , nom ) ) for nom in self.__slots__ )
+
+#====================================================================================================================
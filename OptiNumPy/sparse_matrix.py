@@ -0,0 +1,181 @@
+#=================================================\\Documentation//==================================================
+
+"""
+This module contains a lightweight compressed sparse row (CSR) matrix container and the reverse Cuthill-McKee
+fill-reducing ordering used by the sparse path of equation_solving. scipy.sparse matrices are accepted as well,
+without scipy being imported here.
+
+"""
+
+#================================================\\Libraries needed//================================================
+
+import numpy as np
+from collections import deque
+
+#===============================================\\Compressed sparse row//============================================
+
+class MatriceCSR :
+    """
+    Matrice creuse au format CSR (compressed sparse row).
+
+    Les coefficients non nuls de la ligne ``i`` sont ``data[ indptr[ i ]:indptr[ i+1 ] ]``, dans les colonnes
+    ``indices[ indptr[ i ]:indptr[ i+1 ] ]``.
+
+    Parameters
+    ----------
+    data : ( nnz ) array_like
+        Coefficients non nuls.
+    indices : ( nnz ) array_like
+        Indices de colonne des coefficients.
+    indptr : ( N+1 ) array_like
+        Début de chaque ligne dans ``data`` et ``indices``.
+    shape : tuple
+        Dimensions ( N , M ) de la matrice.
+
+    """
+
+    def __init__( self , data , indices , indptr , shape ) :
+        self.data = np.asarray( data , dtype = float )
+        self.indices = np.asarray( indices , dtype = np.intp )
+        self.indptr = np.asarray( indptr , dtype = np.intp )
+        self.shape = tuple( shape )
+        self.lignes = None
+
+    @classmethod
+    def depuis_dense( cls , A ) :
+        A = np.asarray( A , dtype = float )
+        i , j = np.nonzero( A )
+        return cls.depuis_coordonnees( i , j , A[ i , j ] , A.shape )
+
+    @classmethod
+    def depuis_coordonnees( cls , i , j , v , shape ) :
+        """
+        Construire la matrice à partir de triplets ( i , j , v ) ; les doublons sont additionnés.
+
+        """
+        i = np.asarray( i , dtype = np.intp )
+        j = np.asarray( j , dtype = np.intp )
+        v = np.asarray( v , dtype = float )
+        ordre = np.lexsort(( j , i ))
+        i , j , v = i[ ordre ] , j[ ordre ] , v[ ordre ]
+        nouveau = np.ones( len( i ) , dtype = bool )
+        nouveau[ 1: ] = ( i[ 1: ] != i[ :-1 ] ) | ( j[ 1: ] != j[ :-1 ] )
+        debut = np.flatnonzero( nouveau )
+        v = np.add.reduceat( v , debut ) if len( v ) else v
+        i , j = i[ debut ] , j[ debut ]
+        indptr = np.zeros( shape[ 0 ] + 1 , dtype = np.intp )
+        np.cumsum( np.bincount( i , minlength = shape[ 0 ] ) , out = indptr[ 1: ] )
+        return cls( v , j , indptr , shape )
+
+    @property
+    def nnz( self ) :
+        return len( self.data )
+
+    def indices_lignes( self ) :
+        if self.lignes is None :
+            self.lignes = np.repeat( np.arange( self.shape[ 0 ] ) , np.diff( self.indptr ) )
+        return self.lignes
+
+    def __matmul__( self , x ) :
+        x = np.asarray( x )
+        lignes = self.indices_lignes()
+        if x.ndim == 1 :
+            return np.bincount( lignes , weights = self.data * x[ self.indices ] , minlength = self.shape[ 0 ] )
+        Y = np.zeros(( self.shape[ 0 ] , x.shape[ 1 ] ))
+        for k in range(0,x.shape[1]):
+            Y[ : , k ] = np.bincount( lignes , weights = self.data * x[ self.indices , k ] , minlength = self.shape[ 0 ] )
+        return Y
+
+    def transpose( self ) :
+        return MatriceCSR.depuis_coordonnees( self.indices , self.indices_lignes() , self.data , self.shape[ ::-1 ] )
+
+    @property
+    def T( self ) :
+        return self.transpose()
+
+    def diagonal( self ) :
+        lignes = self.indices_lignes()
+        d = np.zeros( min( self.shape ) )
+        garde = lignes == self.indices
+        d[ lignes[ garde ] ] = self.data[ garde ]
+        return d
+
+    def toarray( self ) :
+        A = np.zeros( self.shape )
+        A[ self.indices_lignes() , self.indices ] = self.data
+        return A
+
+def est_creuse( A ) :
+    return isinstance( A , MatriceCSR ) or hasattr( A , 'tocsr' )
+
+def en_CSR( A ) :
+    """
+    Convertir A en ``MatriceCSR``.
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix or (N, M) array_like
+        Matrice à convertir. Les matrices de scipy.sparse (CSR, CSC, COO...) sont converties sans passer
+        par une matrice dense.
+
+    Returns
+    -------
+    A : MatriceCSR
+        La matrice au format CSR.
+
+    """
+    if isinstance( A , MatriceCSR ) :
+        return A
+    if hasattr( A , 'tocsr' ) :
+        A = A.tocsr()
+        A.sum_duplicates()
+        return MatriceCSR( A.data , A.indices , A.indptr , A.shape )
+    return MatriceCSR.depuis_dense( A )
+
+#================================================\\Fill-reducing ordering//==========================================
+
+def Cuthill_McKee_inverse( A ) :
+    """
+    Calculer la numérotation de Cuthill-McKee inverse de A, qui réduit sa largeur de bande.
+
+    La structure de A + A.T est parcourue en largeur à partir d'un sommet de degré minimal de chaque
+    composante connexe, les voisins étant visités par degré croissant.
+
+    Parameters
+    ----------
+    A : MatriceCSR, scipy.sparse matrix or (N, N) array_like
+        Matrice carrée.
+
+    Returns
+    -------
+    p : ( N ) ndarray
+        Permutation : la ligne et la colonne ``i`` de la matrice renumérotée sont la ligne et la colonne ``p[ i ]`` de A.
+
+    """
+    A = en_CSR( A )
+    N = A.shape[ 0 ]
+    i = A.indices_lignes()
+    j = A.indices
+    S = MatriceCSR.depuis_coordonnees( np.r_[ i , j ] , np.r_[ j , i ] , np.ones( 2 * len( i ) ) , ( N , N ) )
+    indptr = S.indptr
+    voisins = S.indices
+    degre = np.diff( indptr )
+    visite = np.zeros( N , dtype = bool )
+    ordre = [ ]
+    for depart in np.argsort( degre , kind = 'stable' ) :
+        if visite[ depart ] :
+            continue
+        visite[ depart ] = True
+        file = deque([ depart ])
+        while file :
+            k = file.popleft()
+            ordre.append( k )
+            v = voisins[ indptr[ k ]:indptr[ k+1 ] ]
+            v = v[ ~visite[ v ] ]
+            if len( v ) :
+                v = v[ np.argsort( degre[ v ] , kind = 'stable' ) ]
+                visite[ v ] = True
+                file.extend( v.tolist() )
+    return np.array( ordre[ ::-1 ] , dtype = np.intp )
+
+#====================================================================================================================
@@ -0,0 +1,177 @@
+#=================================================\\Documentation//==================================================
+
+"""
+This module contains the forward and back substitution kernels shared by the LU and Cholesky solvers
+of equation_solving and by the Newton methods of multivariate_optimization, and the level-scheduled substitution
+used for sparse triangular factors (incomplete Cholesky preconditioner).
+
+"""
+
+#================================================\\Libraries needed//================================================
+
+import numpy as np
+from .sparse_matrix import en_CSR
+
+#==========================================\\Forward & back substitution//===========================================
+
+def resoudre_triangulaire( T , b , inferieure = True , transposee = False , diag_unite = False , out = None , bloc = 64 ) :
+    """
+    Résoudre un système triangulaire, T x = b ou T.T x = b.
+
+    La descente (ou la remontée) est faite ligne par ligne par produits scalaires vectorisés à l'intérieur
+    d'un bloc de ``bloc`` lignes ; la contribution du bloc aux lignes restantes est reportée par un produit
+    matriciel.
+
+    Parameters
+    ----------
+    T : (N, N) array_like
+        Matrice triangulaire. Seule la partie utile est lue, l'autre partie peut contenir n'importe quoi
+        (par exemple l'autre facteur d'une factorisation LU compacte).
+    b : ( N ) or (N, K) array
+        Côté droit, ou K côtés droits rangés en colonnes.
+    inferieure : bool, optional
+        T est triangulaire inférieure (sinon supérieure). The default is True.
+    transposee : bool, optional
+        Résoudre T.T x = b au lieu de T x = b. The default is False.
+    diag_unite : bool, optional
+        Supposer la diagonale de T égale à 1 sans la lire. The default is False.
+    out : ( N ) or (N, K) ndarray, optional
+        Tableau contigu où écrire la solution ; il peut être ``b`` lui-même, sauf si ``b`` est entier
+        (la solution est alors écrite dans une copie flottante). The default is None.
+    bloc : int, optional
+        Nombre de lignes par bloc. The default is 64.
+
+    Returns
+    -------
+    X : ( N ) or (N, K) array
+        Solution au système (``out`` s'il est donné et peut la recevoir).
+
+    """
+    T = np.asarray( T )
+    M = T.T if transposee else T
+    if out is None or out is b and not np.issubdtype( out.dtype , np.inexact ) :
+        # Un côté droit entier ne peut pas recevoir la solution en place : elle est écrite dans une copie.
+        out = np.array( b , dtype = np.result_type( T.dtype , np.asarray( b ).dtype , float ) )
+    elif out is not b :
+        out[ ... ] = b
+    N = len( M )
+    X = out.reshape( N , -1 )
+    if inferieure != transposee :
+        for k in range(0,N,bloc):
+            kb = min( bloc , N - k )
+            for i in range(k,k+kb):
+                X[ i ] -= M[ i , k:i ] @ X[ k:i ]
+                if not diag_unite :
+                    X[ i ] /= M[ i , i ]
+            if k + kb < N :
+                X[ k+kb: ] -= M[ k+kb: , k:k+kb ] @ X[ k:k+kb ]
+    else:
+        for k in range(N,0,-bloc):
+            kb = min( bloc , k )
+            for i in range(k-1,k-kb-1,-1):
+                X[ i ] -= M[ i , i+1:k ] @ X[ i+1:k ]
+                if not diag_unite :
+                    X[ i ] /= M[ i , i ]
+            if k - kb > 0 :
+                X[ :k-kb ] -= M[ :k-kb , k-kb:k ] @ X[ k-kb:k ]
+    return out
+
+def descente( L , b , diag_unite = False , out = None ) :
+    """
+    Résoudre L x = b avec L triangulaire inférieure.
+
+    Voir ``resoudre_triangulaire``.
+
+    """
+    return resoudre_triangulaire( L , b , True , False , diag_unite , out )
+
+def remontee( U , b , diag_unite = False , out = None ) :
+    """
+    Résoudre U x = b avec U triangulaire supérieure.
+
+    Voir ``resoudre_triangulaire``.
+
+    """
+    return resoudre_triangulaire( U , b , False , False , diag_unite , out )
+
+#==========================================\\Sparse triangular matrices//============================================
+
+class TriangulaireCreuse :
+    """
+    Matrice triangulaire creuse préparée pour des résolutions répétées par niveaux.
+
+    Les inconnues sont regroupées en niveaux : celles d'un même niveau ne dépendent que des niveaux
+    précédents et sont calculées ensemble par une opération vectorisée. Une résolution coûte O(nnz)
+    opérations en autant d'étapes que de niveaux (de l'ordre de sqrt(N) pour un laplacien 2-D),
+    au lieu d'une étape par ligne.
+
+    Parameters
+    ----------
+    T : MatriceCSR, scipy.sparse matrix or (N, N) array_like
+        Matrice triangulaire à diagonale non nulle. Seule la partie utile est lue.
+    inferieure : bool, optional
+        T est triangulaire inférieure (sinon supérieure). The default is True.
+
+    """
+
+    def __init__( self , T , inferieure = True ) :
+        T = en_CSR( T )
+        N = T.shape[ 0 ]
+        lignes = T.indices_lignes()
+        garde = T.indices < lignes if inferieure else T.indices > lignes
+        diagonale = T.diagonal()
+        if np.any( diagonale == 0 ) :
+            raise np.linalg.LinAlgError( "Pivot nul dans la matrice triangulaire" )
+        lignes , colonnes , valeurs = lignes[ garde ] , T.indices[ garde ] , T.data[ garde ]
+        # Niveau d'une ligne : 1 + le plus grand niveau des inconnues dont elle dépend.
+        debut = np.searchsorted( lignes , np.arange( N + 1 ) ).tolist()
+        cols = colonnes.tolist()
+        niveau = [ 0 ] * N
+        for i in ( range(0,N) if inferieure else range(N-1,-1,-1) ) :
+            niveau[ i ] = 1 + max(( niveau[ j ] for j in cols[ debut[ i ]:debut[ i+1 ] ] ) , default = -1 )
+        niveau = np.array( niveau , dtype = np.intp )
+        ordre = np.argsort( niveau , kind = 'stable' )
+        bornes = np.searchsorted( niveau[ ordre ] , np.arange( niveau.max( initial = -1 ) + 2 ) )
+        niveau_coef = niveau[ lignes ]
+        ordre_coef = np.argsort( niveau_coef , kind = 'stable' )
+        bornes_coef = np.searchsorted( niveau_coef[ ordre_coef ] , np.arange( len( bornes ) ) )
+        # Les inconnues sont renumérotées par niveau : chaque niveau est une tranche contiguë.
+        rang = np.empty( N , dtype = np.intp )
+        rang[ ordre ] = np.arange( N )
+        self.ordre = ordre
+        self.diagonale = diagonale[ ordre ]
+        self.niveaux = [ ]
+        for k in range(0,len(bornes)-1):
+            e = ordre_coef[ bornes_coef[ k ]:bornes_coef[ k+1 ] ]
+            self.niveaux.append(( bornes[ k ] , bornes[ k+1 ] , rang[ lignes[ e ] ] - bornes[ k ] ,
+                                  rang[ colonnes[ e ] ] , valeurs[ e ] ))
+        self.shape = T.shape
+
+    def resoudre( self , b , out = None ) :
+        """
+        Résoudre T x = b.
+
+        Parameters
+        ----------
+        b : ( N ) array
+            Côté droit.
+        out : ( N ) ndarray, optional
+            Tableau où écrire la solution ; il peut être ``b`` lui-même. The default is None.
+
+        Returns
+        -------
+        x : ( N ) array
+            Solution au système.
+
+        """
+        y = np.asarray( b , dtype = float )[ self.ordre ]
+        d = self.diagonale
+        for debut , fin , locales , colonnes , valeurs in self.niveaux :
+            if len( valeurs ) :
+                y[ debut:fin ] -= np.bincount( locales , weights = valeurs * y[ colonnes ] , minlength = fin - debut )
+            y[ debut:fin ] /= d[ debut:fin ]
+        x = np.empty_like( y ) if out is None else out
+        x[ self.ordre ] = y
+        return x
+
+#====================================================================================================================
@@ -9,8 +9,79 @@ using both the search with elimination and search with interpolation methods.
 #================================================\\Libraries needed//================================================
 
 import numpy as np
-import numdifftools as nd
 import math as m
+from collections import OrderedDict
+from .optimization_result import ResultatOptimisation , historique_depuis
+
+#==================================================\\Evaluation cache//==============================================
+
+class CacheEvaluations :
+    """
+    Enveloppe d'une fonction d'une variable réel qui mémorise ses valeurs déjà calculées.
+
+    Toutes les méthodes de ce module passent par cette enveloppe : un point déjà évalué n'est
+    jamais recalculé. Les nombres d'évaluations et de valeurs retrouvées sont reportés dans
+    ``nfev`` et ``nhits`` du résultat ; passer directement un ``CacheEvaluations`` permet en plus
+    de régler ``tol`` et ``taille_max`` ou de partager le cache entre plusieurs appels.
+
+    Parameters
+    ----------
+    f : callable
+        La fonction à mémoriser, ``f( x ) -> float``.
+    tol : float, optional
+        Deux points sont confondus s'ils tombent dans la même case de largeur ``tol``
+        (0 : égalité exacte). The default is 0.
+    taille_max : int, optional
+        Nombre maximal de valeurs gardées, les plus anciennes étant oubliées en premier.
+        The default is None (pas de limite).
+
+    Attributes
+    ----------
+    nfev : int
+        Nombre d'évaluations effectives de ``f``.
+    nhits : int
+        Nombre de valeurs retrouvées dans le cache.
+
+    """
+
+    def __init__( self , f , tol = 0.0 , taille_max = None ) :
+        self.f = f
+        self.tol = tol
+        self.taille_max = taille_max
+        self.valeurs = OrderedDict()
+        self.nfev = 0
+        self.nhits = 0
+
+    def __call__( self , x ) :
+        cle = round( x / self.tol ) if self.tol else float( x )
+        if cle in self.valeurs :
+            self.nhits += 1
+            self.valeurs.move_to_end( cle )
+            return self.valeurs[ cle ]
+        self.nfev += 1
+        v = self.f( x )
+        self.valeurs[ cle ] = v
+        if self.taille_max is not None and len( self.valeurs ) > self.taille_max :
+            self.valeurs.popitem( last = False )
+        return v
+
+    def valeur_connue( self , x ) :
+        # Valeur déjà calculée en x, ou None ; rien n'est évalué ni compté.
+        return self.valeurs.get( round( x / self.tol ) if self.tol else float( x ) )
+
+    def evaluer_bloc( self , x ) :
+        # Évaluation vectorisée d'un bloc de points, comptée mais pas mémorisée.
+        x = np.asarray( x )
+        self.nfev += x.size
+        return np.asarray( self.f( x ) , dtype = float )
+
+def avec_cache( f ) :
+    return f if isinstance( f , CacheEvaluations ) else CacheEvaluations( f )
+
+def resultat_univarie( x , f , H ) :
+    # La valeur finale n'est donnée que si x a déjà été évalué : pas d'évaluation de plus pour la remplir.
+    fun = f.valeur_connue( x )
+    return ResultatOptimisation( x , fun , H.n , f.nfev , historique = H.valeurs() , nhits = f.nhits )
 
 
 #=======================================\\Searching with elimination methods//=======================================
@@ -20,7 +91,7 @@ import math as m
 # Search with fixed step size:
 
 
-def fixed_step_size( x0 , p ,f ) :
+def fixed_step_size( x0 , p ,f , vectorized = False , taille_bloc = 1024 , historique = None ) :
     """ Minimisation de la fonction scalaire d'une variable réel.
     
     Parameters
@@ -35,38 +106,59 @@ def fixed_step_size( x0 , p ,f ) :
       
          ``f( x ) -> float``
          
-      où ``x`` est un nombre réel 
-      
+      où ``x`` est un nombre réel ; avec ``vectorized=True``, ``x`` est un tableau de points et
+      ``f`` retourne le tableau des valeurs.
+    vectorized : bool, optional
+      Évaluer ``f`` sur des blocs de ``taille_bloc`` pas en un seul appel. The default is False.
+    taille_bloc : int, optional
+      Nombre de points évalués par appel en mode vectorisé. The default is 1024.
+    historique : None, bool or tuple, optional
+        Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+        The default is None.
+
     Returns
     -------
-    res : float
-       Le résultat de l'optimisation.
-    List_sol_iteration : list
-                        liste des solution 
+    res : ResultatOptimisation
+       Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
     """    
+    f = avec_cache( f )
+    H = historique_depuis( historique )
    
     f0 = f( x0 )
     if f0 > f( x0 + p ) :
         i = 1
     if f0 > f( x0 - p ) :
         i = -1
+    if vectorized :
+        k0 = 0
+        while True :
+            k = np.arange( k0 , k0 + taille_bloc + 1 )
+            fx = f.evaluer_bloc( x0 + i * p * k[ 1: ] )
+            fx = np.r_[ f0 , fx ]
+            arret = np.flatnonzero( fx[ 1: ] >= fx[ :-1 ] )
+            if len( arret ) :
+                k = np.arange( 0 , k[ arret[ 0 ] ] + 1 )
+                H.ajouter_bloc( x0 + i * p * k )
+                return resultat_univarie( x0 + i * p * k[ -1 ] , f , H )
+            k0 = k0 + taille_bloc
+            f0 = fx[ -1 ]
  
     x1 = x0 + i * p
     f1 = f( x1 )
-    List_sol_iteration = [ x0 ]
+    H.ajouter( x0 )
     while f1 < f0 :
          x0 = x1
          x1 = x0 + i * p
          f0 = f1
          f1 = f( x1 )
-         List_sol_iteration.append( x0 )
+         H.ajouter( x0 )
     res = x0
-    return res,List_sol_iteration
+    return resultat_univarie( res , f , H )
 
 # Search with accelerated step size:
 
-def accelerated_step_size( x0 , p , f ) :
+def accelerated_step_size( x0 , p , f , historique = None ) :
          """ Minimisation de la fonction scalaire d'une variable réel.
          
          Parameters
@@ -82,15 +174,18 @@ def accelerated_step_size( x0 , p , f ) :
               ``f( x ) -> float``
               
            où ``x`` est un nombre réel 
-           
+         historique : None, bool or tuple, optional
+             Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+             The default is None.
+
          Returns
          -------
-         res : float
-            Le résultat de l'optimisation.
-         List_sol_iteration : list
-                             liste des solution 
+         res : ResultatOptimisation
+            Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
          """
+         f = avec_cache( f )
+         H = historique_depuis( historique )
          
          f0 = f( x0 )
          x1 = x0
@@ -98,7 +193,7 @@ def accelerated_step_size( x0 , p , f ) :
             i = 1
          if f0 > f( x0 - p ) :
             i = -1
-         List_sol_iteration = [ x0 ]
+         H.ajouter( x0 )
          while  round( abs( x1 - x0 ) , 2 ) != p :
             k = i * p
             x1 = x0 + k
@@ -109,13 +204,13 @@ def accelerated_step_size( x0 , p , f ) :
               x1 = x0 + k
               f0 = f1
               f1 = f( x1 )
-              List_sol_iteration.append( x0 )
+              H.ajouter( x0 )
             res = x0
-         return res,List_sol_iteration
+         return resultat_univarie( res , f , H )
      
 # 2.EXHAUSTIVE SEARCH:
     
-def Exhaustive_search( a , b , n ,f ) :
+def Exhaustive_search( a , b , n ,f , vectorized = False , taille_bloc = 1024 , historique = None ) :
             """ Minimisation de la fonction scalaire d'une variable réel.
             
 
@@ -132,33 +227,64 @@ def Exhaustive_search( a , b , n ,f ) :
               
                  ``f( x ) -> float``
                  
-              où ``x`` est un nombre réel 
+              où ``x`` est un nombre réel ; avec ``vectorized=True``, ``x`` est un tableau de points et
+              ``f`` retourne le tableau des valeurs.
+            vectorized : bool, optional
+                Évaluer ``f`` sur des blocs de ``taille_bloc`` points de la grille en un seul appel et
+                chercher l'encadrement du minimum par comparaison vectorisée. The default is False.
+            taille_bloc : int, optional
+                Nombre de points évalués par appel en mode vectorisé. The default is 1024.
+            historique : None, bool or tuple, optional
+                Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+                The default is None.
 
             Returns
             -------
-            res : float
-               Le résultat de l'optimisation.
-            List_sol_iteration : list
-                                 liste des solution 
+            res : ResultatOptimisation
+               Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
 
             """
+            f = avec_cache( f )
+            H = historique_depuis( historique )
            
-            x1 = a
             h = ( b - a ) / n
+            if vectorized :
+                # Les deux dernières valeurs du bloc précédent servent de bord gauche au bloc suivant ;
+                # les blocs s'arrêtent au dernier point de la grille, b.
+                k = np.arange( 0 , min( taille_bloc , n - 1 ) + 2 )
+                fx = f.evaluer_bloc( np.minimum( a + h * k , b ) )
+                fa = fx[ 0 ]
+                while True :
+                    minimum = ( fx[ 1:-1 ] <= fx[ :-2 ] ) & ( fx[ 1:-1 ] <= fx[ 2: ] )
+                    if minimum.any() :
+                        i = k[ np.argmax( minimum ) + 1 ]
+                        H.ajouter_bloc( a + h * np.arange( 1 , i + 1 ) )
+                        return resultat_univarie( a + h * i , f , H )
+                    if k[ -1 ] >= n :
+                        H.ajouter_bloc( a + h * np.arange( 1 , n ) )
+                        return resultat_univarie( a if fa <= fx[ -1 ] else min( a + h * n , b ) , f , H )
+                    k = np.arange( k[ -2 ] , min( k[ -1 ] + taille_bloc , n ) + 1 )
+                    fx = np.r_[ fx[ -2: ] , f.evaluer_bloc( np.minimum( a + h * k[ 2: ] , b ) ) ]
+            x1 = a
             x2 = x1 + h
             x3 = x2 + h
             f1 = f( x1 )
             f2 = f( x2 )
             f3 = f( x3 )
-            List_sol_iteration = [ ]
+            fa = f1
+            j = 2
             while 1:
-                List_sol_iteration.append( ( x1+ x3)/2)
+                H.ajouter( ( x1+ x3)/2)
 
                 if f2 <= f1 and f2 <= f3 :
                      res = ( x1 +x3 ) / 2
-                     return res , List_sol_iteration
+                     return resultat_univarie( res , f , H )
+                elif j >= n :
+                     # Grille parcourue jusqu'à b sans minimum intérieur : le minimum est à une borne.
+                     return resultat_univarie( a if fa <= f3 else x3 , f , H )
                 else:
+                    j = j + 1
                     x1 = x2
                     f1 = f2
                     x2 = x3
@@ -169,7 +295,7 @@ def Exhaustive_search( a , b , n ,f ) :
 
 # 3.DICHOTOMOUS SEARCH:
     
-def Dichotomous_search( a , b , f , tol = 1e-3 ) :
+def Dichotomous_search( a , b , f , tol = 1e-3 , historique = None ) :
             """ Minimisation de la fonction scalaire d'une variable réel.
             
 
@@ -188,22 +314,24 @@ def Dichotomous_search( a , b , f , tol = 1e-3 ) :
               
             tol : float, optional
                 Tolérance pour la terminaison. The default is 1e-3.
+            historique : None, bool or tuple, optional
+                Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+                The default is None.
 
             Returns
             -------
-            res : float
-               Le résultat de l'optimisation.
-            List_sol_iteration : list
-                                  liste des solution
+            res : ResultatOptimisation
+               Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
                
             """
+            f = avec_cache( f )
+            H = historique_depuis( historique )
 
             a1 = a
             b1 = b
-            List_sol_iteration = [ ]
             while round( b1 - a1 , 2 ) > tol :
                 m = ( a1 + b1 ) / 2
-                List_sol_iteration.append( m )
+                H.ajouter( m )
                 x1 = m - tol / 2
                 x2 = m + tol / 2
                 if f( x1 ) < f( x2 ) :
@@ -212,13 +340,13 @@ def Dichotomous_search( a , b , f , tol = 1e-3 ) :
                     a1 = x1
 
             res=( a1 + b1 ) / 2
-            return res , List_sol_iteration
+            return resultat_univarie( res , f , H )
 
 
 # 4.INTERVAL HALVING METHOD:
 
     
-def Interval_Halving_Method( a , b , f , tol = 1e-3 ) :
+def Interval_Halving_Method( a , b , f , tol = 1e-3 , historique = None ) :
             """ Minimisation de la fonction scalaire d'une variable réel.
             
 
@@ -236,23 +364,25 @@ def Interval_Halving_Method( a , b , f , tol = 1e-3 ) :
               où ``x`` est un nombre réel 
             tol : float, optional
                 Tolérance pour la terminaison. The default is 1e-3.
+            historique : None, bool or tuple, optional
+                Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+                The default is None.
 
             Returns
             -------
-            res : float
-               Le résultat de l'optimisation.
-            List_sol_iteration : list
-                                   liste des solution
+            res : ResultatOptimisation
+               Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
                 
                
             """
+            f = avec_cache( f )
+            H = historique_depuis( historique )
             
             m = ( a + b ) / 2
-            List_sol_iteration = [ ]
             L = b - a
             f0 = f( m )
             while 1 :
-                List_sol_iteration.append( m )
+                H.ajouter( m )
                 x1 = a + L / 4
                 x2 = b - L / 4
                 f1 = f( x1 )
@@ -271,7 +401,7 @@ def Interval_Halving_Method( a , b , f , tol = 1e-3 ) :
                 L = b - a
                 if abs( L ) < tol :
                      res = ( a + b ) / 2
-                     return res , List_sol_iteration
+                     return resultat_univarie( res , f , H )
                     
 # 5.FIBONACCI METHOD:
 
@@ -290,24 +420,59 @@ def suite_Fibonacci( n ) :
                    n ième terme d'une suite.
 
             """
-            f0 = f1 = 1
-            for i in range( 2 , n + 1 ):
-               f = f0 + f1
-               f0 = f1
-               f1 = f
-            res = f1
+            while len( table_Fibonacci ) <= n :
+               table_Fibonacci.append( table_Fibonacci[ -1 ] + table_Fibonacci[ -2 ] )
+            res = table_Fibonacci[ max( n , 0 ) ]
             return res
 
+# Termes de la suite déjà calculés, partagés par tous les appels.
+table_Fibonacci = [ 1 , 1 ]
 
+def ratios_Fibonacci( n ) :
+            """
+            Calculer d'un coup les rapports ``F( n - k + 1 ) / F( n + 1 )`` utilisés par la méthode de Fibonacci.
+
+             Parameters
+             ----------
+             n : int
+                 Le nombre d'itérations.
+
+             Returns
+             -------
+             ratios : ( n+1 ) ndarray
+                   ``ratios[ k ]`` est la fraction de l'intervalle initial qui place les points de l'itération ``k``.
+
+            """
+            Fn = suite_Fibonacci( n + 1 )
+            ratios = np.array([ table_Fibonacci[ n - k + 1 ] / Fn for k in range(0,n+1) ])
+            return ratios
 
-def Fibonacci_method( n , a , b , f ) :
+def nombre_Fibonacci( a , b , tol ) :
+            """
+            Calculer le plus petit nombre d'itérations de la méthode de Fibonacci qui réduit ``[ a , b ]`` à une longueur ``tol``.
+
+            L'intervalle final a pour longueur ``2 ( b - a ) / F( n + 1 )``.
+
+             Returns
+             -------
+             n : int
+                 Le nombre d'itérations.
+
+            """
+            cible = 2 * ( b - a ) / tol
+            n = 1
+            while suite_Fibonacci( n + 1 ) < cible :
+               n = n + 1
+            return n
+
+def Fibonacci_method( n , a , b , f , tol = None , historique = None ) :
             """ Minimisation de la fonction scalaire d'une variable réel.
             
 
             Parameters
             ----------
-            n : int
-                Le nombre d'itérations.
+            n : int or None
+                Le nombre d'itérations ; s'il vaut None, il est déduit de ``tol``.
             a : float
                 Bornes inférieure de domine de recherche.
             b : float
@@ -318,42 +483,59 @@ def Fibonacci_method( n , a , b , f ) :
                  ``f( x ) -> float``
                  
               où ``x`` est un nombre réel
+            tol : float, optional
+                Longueur visée de l'intervalle final, utilisée si ``n`` vaut None.
+                The default is None (1e-3).
+            historique : None, bool or tuple, optional
+                Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+                The default is None.
 
             Returns
             -------
-            res : float
-               Le résultat de l'optimisation.
-            List_sol_iteration : list
-                                  liste des solution    
+            res : ResultatOptimisation
+               Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
             """
            
+            f = avec_cache( f )
+            H = historique_depuis( historique )
+            if n is None :
+                n = nombre_Fibonacci( a , b , 1e-3 if tol is None else tol )
+            ratios = ratios_Fibonacci( n )
             l = b - a
             k = 1
-            List_sol_iteration = [ ]
-            while k != n :
-                List_sol_iteration.append( (a+b)/2)
+            # Le point intérieur qui survit à une itération est réutilisé à la suivante.
+            x1 = x2 = None
+            while k < n :
+                H.ajouter( (a+b)/2)
                 k = k + 1
-                L= ( suite_Fibonacci( n - k + 1 ) / suite_Fibonacci( n + 1 ) ) * l
-                x1 = a + L
-                x2 = b - L
-                f1 = f( x1 )
-                f2 = f( x2 )
+                L= ratios[ k ] * l
+                if x1 is None :
+                    x1 = a + L
+                    f1 = f( x1 )
+                if x2 is None :
+                    x2 = b - L
+                    f2 = f( x2 )
                 if f1 < f2 :
                     b = x2
-                if f2 < f1 :
+                    x2 , f2 = x1 , f1
+                    x1 = None
+                elif f2 < f1 :
                     a = x1
-                if f1 == f2 :
+                    x1 , f1 = x2 , f2
+                    x2 = None
+                else :
                     a = x1
                     b = x2
+                    x1 = x2 = None
                     k = k + 1
             res = ( a + b ) / 2
-            return res , List_sol_iteration
+            return resultat_univarie( res , f , H )
 
 # 6.GOLDEN SECTION METHOD:
     
     
-def Golden_section( a , b , f , tol = 1e-3 ) :
+def Golden_section( a , b , f , tol = 1e-3 , historique = None ) :
             """ Minimisation de la fonction scalaire d'une variable réel.
             
 
@@ -371,14 +553,17 @@ def Golden_section( a , b , f , tol = 1e-3 ) :
                    où ``x`` est un nombre réel 
             tol : float, optional
                 Tolérance pour la terminaison. The default is 1e-3.
+            historique : None, bool or tuple, optional
+                Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+                The default is None.
 
             Returns
             -------
-            res : float
-               Le résultat de l'optimisation.
-            List_sol_iteration : list
-                                   liste des solution    
+            res : ResultatOptimisation
+               Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
             """
+            f = avec_cache( f )
+            H = historique_depuis( historique )
             inv_nbr_or = 0.618 # L'inverse du nombre d'or
             a1 = a
             b1 = b
@@ -386,9 +571,8 @@ def Golden_section( a , b , f , tol = 1e-3 ) :
             x2 = a1 + inv_nbr_or * ( b1 - a1 )
             f1 = f( x1 )
             f2 = f( x2 )
-            List_sol_iteration = [ ]
             while 1 :
-                List_sol_iteration.append((a1+b1)/2)
+                H.ajouter((a1+b1)/2)
                 if f2 > f1:
                     b1 = x2
                     x2 = x1
@@ -403,7 +587,148 @@ def Golden_section( a , b , f , tol = 1e-3 ) :
                     f2 = f( x2 )
                 if round( b1 - a1 , 3 ) <= tol :
                         res = ( a1 + b1 ) / 2
-                        return  res , List_sol_iteration
+                        return  resultat_univarie( res , f , H )
+
+
+# 7.BATCHED FIBONACCI & GOLDEN SECTION METHODS:
+
+def Fibonacci_method_batch( n , a , b , f , tol = None ) :
+            """ Minimisation simultanée de plusieurs fonctions scalaires d'une variable réel par la méthode de Fibonacci.
+            
+            Tous les intervalles avancent ensemble par mises à jour masquées, avec une seule évaluation
+            vectorisée de ``f`` par itération au nouveau point intérieur de chaque problème ; un problème
+            est retiré dès qu'il a fait ses ``n`` itérations.
+
+            Parameters
+            ----------
+            n : int or None
+                Le nombre d'itérations ; s'il vaut None, il est déduit de ``tol`` et du plus long intervalle.
+            a : ( B ) array_like
+                Bornes inférieures des domines de recherche.
+            b : ( B ) array_like
+                Bornes supérieures des domines de recherche.
+            f : callable
+                Les fonctions objectives à minimiser, évaluées en un seul appel.
+              
+                 ``f( x , idx ) -> ndarray``
+                 
+              où ``x`` est un tableau de points et ``idx`` le tableau des numéros des problèmes
+              correspondants ( ``x[ k ]`` est un point du problème ``idx[ k ]`` ).
+            tol : float, optional
+                Longueur visée des intervalles finaux, utilisée si ``n`` vaut None.
+                The default is None (1e-3).
+
+            Returns
+            -------
+            res : ( B ) ndarray
+               Les résultats de l'optimisation.
+            nit : ( B ) ndarray
+               Nombre d'itérations de chaque problème.
+
+            """
+            a = np.array( a , dtype = float )
+            b = np.array( b , dtype = float )
+            l = b - a
+            if n is None :
+                n = nombre_Fibonacci( 0 , np.max( l , initial = 0 ) , 1e-3 if tol is None else tol )
+            k = np.ones( len( a ) , dtype = int )
+            ratios = ratios_Fibonacci( n )
+            nit = np.zeros( len( a ) , dtype = int )
+            x1 , x2 = np.empty_like( a ) , np.empty_like( a )
+            f1 , f2 = np.empty_like( a ) , np.empty_like( a )
+            # Le point intérieur qui survit à une itération est réutilisé à la suivante :
+            # seuls les points marqués nouveaux sont évalués.
+            nouveau1 = np.ones( len( a ) , dtype = bool )
+            nouveau2 = np.ones( len( a ) , dtype = bool )
+            idx = np.flatnonzero( k < n )
+            while len( idx ) :
+                k[ idx ] += 1
+                nit[ idx ] += 1
+                L = ratios[ k[ idx ] ] * l[ idx ]
+                n1 , n2 = nouveau1[ idx ] , nouveau2[ idx ]
+                g , d = idx[ n1 ] , idx[ n2 ]
+                x1[ g ] = a[ g ] + L[ n1 ]
+                x2[ d ] = b[ d ] - L[ n2 ]
+                fx = np.asarray( f( np.r_[ x1[ g ] , x2[ d ] ] , np.r_[ g , d ] ) , dtype = float )
+                f1[ g ] = fx[ :len( g ) ]
+                f2[ d ] = fx[ len( g ): ]
+                gauche = f1[ idx ] < f2[ idx ]
+                droite = f2[ idx ] < f1[ idx ]
+                G , D , E = idx[ gauche ] , idx[ droite ] , idx[ ~gauche & ~droite ]
+                b[ G ] = x2[ G ]
+                x2[ G ] = x1[ G ]
+                f2[ G ] = f1[ G ]
+                a[ D ] = x1[ D ]
+                x1[ D ] = x2[ D ]
+                f1[ D ] = f2[ D ]
+                a[ E ] = x1[ E ]
+                b[ E ] = x2[ E ]
+                k[ E ] += 1
+                nouveau1[ idx ] = ~droite
+                nouveau2[ idx ] = ~gauche
+                idx = idx[ k[ idx ] < n ]
+            res = ( a + b ) / 2
+            return res , nit
+
+def Golden_section_batch( a , b , f , tol = 1e-3 ) :
+            """ Minimisation simultanée de plusieurs fonctions scalaires d'une variable réel par la méthode du nombre d'or.
+            
+            Tous les intervalles avancent ensemble par mises à jour masquées, avec une seule évaluation
+            vectorisée de ``f`` par itération ; un problème est retiré dès que son intervalle est assez petit.
+
+            Parameters
+            ----------
+            a : ( B ) array_like
+                Bornes inférieures des domines de recherche.
+            b : ( B ) array_like
+                Bornes supérieures des domines de recherche.
+            f : callable
+                Les fonctions objectives à minimiser, évaluées en un seul appel.
+              
+                 ``f( x , idx ) -> ndarray``
+                 
+              où ``x`` est un tableau de points et ``idx`` le tableau des numéros des problèmes
+              correspondants ( ``x[ k ]`` est un point du problème ``idx[ k ]`` ).
+            tol : float, optional
+                Tolérance pour la terminaison. The default is 1e-3.
+
+            Returns
+            -------
+            res : ( B ) ndarray
+               Les résultats de l'optimisation.
+            nit : ( B ) ndarray
+               Nombre d'itérations de chaque problème.
+
+            """
+            inv_nbr_or = 0.618 # L'inverse du nombre d'or
+            a1 = np.array( a , dtype = float )
+            b1 = np.array( b , dtype = float )
+            B = len( a1 )
+            x1 = b1 - inv_nbr_or * ( b1 - a1 )
+            x2 = a1 + inv_nbr_or * ( b1 - a1 )
+            tous = np.arange( B )
+            fx = np.asarray( f( np.r_[ x1 , x2 ] , np.r_[ tous , tous ] ) , dtype = float )
+            f1 , f2 = fx[ :B ].copy() , fx[ B: ].copy()
+            nit = np.zeros( B , dtype = int )
+            idx = tous
+            while len( idx ) :
+                nit[ idx ] += 1
+                gauche = f2[ idx ] > f1[ idx ]
+                g , d = idx[ gauche ] , idx[ ~gauche ]
+                b1[ g ] = x2[ g ]
+                x2[ g ] = x1[ g ]
+                f2[ g ] = f1[ g ]
+                x1[ g ] = b1[ g ] - inv_nbr_or * ( b1[ g ] - a1[ g ] )
+                a1[ d ] = x1[ d ]
+                x1[ d ] = x2[ d ]
+                f1[ d ] = f2[ d ]
+                x2[ d ] = a1[ d ] + inv_nbr_or * ( b1[ d ] - a1[ d ] )
+                fx = np.asarray( f( np.r_[ x1[ g ] , x2[ d ] ] , np.r_[ g , d ] ) , dtype = float )
+                f1[ g ] = fx[ :len( g ) ]
+                f2[ d ] = fx[ len( g ): ]
+                idx = idx[ np.round( b1[ idx ] - a1[ idx ] , 3 ) > tol ]
+            res = ( a1 + b1 ) / 2
+            return res , nit
 
 
 
@@ -412,7 +737,7 @@ def Golden_section( a , b , f , tol = 1e-3 ) :
 # 1.NEWTON-RAPHSON METHOD:
 
 
-def Newton_method( x0 , fp , fpp , tol = 1e-3 ) :
+def Newton_method( x0 , fp , fpp , tol = 1e-3 , historique = None ) :
     """ Minimisation de la fonction scalaire d'une variable réel.
     
     Parameters
@@ -433,29 +758,33 @@ def Newton_method( x0 , fp , fpp , tol = 1e-3 ) :
           où ``x`` est un nombre réel 
     tol : float, optional
         Tolérance pour la terminaison. The default is 1e-3.
+    historique : None, bool or tuple, optional
+        Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+        The default is None.
 
     Returns
     -------
-    res : float
-       Le résultat de l'optimisation.
-    List_sol_iteration : list
-                           liste des solution
+    res : ResultatOptimisation
+       Le résultat de l'optimisation ; ``x , historique = res`` donne le minimum et les itérés gardés.
 
     """
-    List_sol_iteration = [ x0 ]
+    fp = avec_cache( fp )
+    fpp = avec_cache( fpp )
+    H = historique_depuis( historique )
+    H.ajouter( x0 )
     f0 = fp( x0 )
     while abs( f0 ) > tol :
         x = x0 - f0 / fpp ( x0 )
         x0 = x
         f0 = fp( x0 )
-        List_sol_iteration.append(x0 )
+        H.ajouter(x0 )
     res = x0
-    return res , List_sol_iteration
+    return ResultatOptimisation( res , None , H.n , 0 , fp.nfev , historique = H.valeurs() , nhits = fp.nhits )
 
 
 # 2.QUASI-NEWTON METHOD:
 
-def Quasi_Newton( x0 , f , tol = 1e-3 ) :
+def Quasi_Newton( x0 , f , tol = 1e-3 , historique = None ) :
     """ Minimisation de la fonction scalaire d'une variable réel.
     
     Parameters
@@ -470,34 +799,36 @@ def Quasi_Newton( x0 , f , tol = 1e-3 ) :
             où ``x`` est un nombre réel 
      tol : float, optional
          Tolérance pour la terminaison. The default is 1e-3.
+     historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
 
      Returns
      -------
-     x : float
-        Le résultat de l'optimisation.
-     List_sol_iteration : list
-                            liste des solution
+     x : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = x`` donne le minimum et les itérés gardés.
 
 
     """
+    f = avec_cache( f )
+    H = historique_depuis( historique )
   
     h=1e-2
-    List_sol_iteration = [ ]
     while True:
-        List_sol_iteration.append( x0 )
+        H.ajouter( x0 )
         f0 = f( x0 )
         f1 = f( x0 - h )
         f2 = f( x0 + h )
         x = x0 - h * ( f2 - f1 ) / ( 2 * ( f2 - 2 * f0 + f1 ) )
         x0 = x
         if abs ( ( f2 - f1 ) / ( 2 * h ) ) <= tol :
-            return x , List_sol_iteration
+            return resultat_univarie( x , f , H )
         
         
 # 3.SECANT METHOD:
     
     
-def Secant_method( x0  , fp , tol = 1e-3 ) :
+def Secant_method( x0  , fp , tol = 1e-3 , historique = None ) :
     """ Minimisation de la fonction scalaire d'une variable réel.
     
     Parameters
@@ -512,15 +843,17 @@ def Secant_method( x0  , fp , tol = 1e-3 ) :
             où ``x`` est un nombre réel 
      tol : float, optional
          Tolérance pour la terminaison. The default is 1e-3.
+     historique : None, bool or tuple, optional
+         Itérés à garder : None (aucun), True (tous), ``( 'derniers' , k )`` ou ``( 'chaque' , m )``.
+         The default is None.
 
      Returns
      -------
-     x : float
-        Le résultat de l'optimisation.
-    List_sol_iteration : list
-                           liste des solution
+     x : ResultatOptimisation
+        Le résultat de l'optimisation ; ``x , historique = x`` donne le minimum et les itérés gardés.
 
     """
+    fp = avec_cache( fp )
     A = x0
     h = 1e-2
     while fp( h ) < 0 :
@@ -529,13 +862,13 @@ def Secant_method( x0  , fp , tol = 1e-3 ) :
     B = h
     fA = fp( A )
     fB = fp( B )
-    List_sol_iteration = []
+    H = historique_depuis( historique )
     while True :
         x = A - fA * ( B - A ) / ( fB - fA )
-        List_sol_iteration.append( x )
+        H.ajouter( x )
         fx = fp( x )
         if abs( fx ) <= tol :
-          return x , List_sol_iteration
+          return ResultatOptimisation( x , None , H.n , 0 , fp.nfev , historique = H.valeurs() , nhits = fp.nhits )
         if fx < 0 :
           A = x
           fA = fp( A )
@@ -0,0 +1,73 @@
+#=================================================\\Documentation//==================================================
+
+"""
+Import-time benchmark of OptiNumPy.
+
+Each import is timed in a fresh interpreter, numpy being imported beforehand so that only the cost of OptiNumPy
+itself is measured, and the best of several runs is compared to the budget below. The benchmark also checks that
+no heavy optional dependency is loaded. It exits with status 1 if a budget is exceeded.
+
+    python benchmarks/import_time.py
+
+"""
+
+#================================================\\Libraries needed//================================================
+
+import os
+import subprocess
+import sys
+
+#=====================================================\\Budget//=====================================================
+
+# Temps d'import maximal en millisecondes, numpy déjà importé.
+BUDGET = {
+    'OptiNumPy' : 5 ,
+    'OptiNumPy.univariate_optimization' : 20 ,
+    'OptiNumPy.multivariate_optimization' : 20 ,
+    'OptiNumPy.equation_solving' : 20 ,
+    'OptiNumPy.global_search' : 20 ,
+}
+
+# Modules qui ne doivent pas être chargés par ces imports.
+INTERDITS = ( 'numdifftools' , 'scipy' )
+
+REPETITIONS = 5
+
+MESURE = """
+import sys , time
+import numpy
+t = time.perf_counter()
+import {module}
+t = time.perf_counter() - t
+print( t * 1000 , *[ m for m in {interdits!r} if m in sys.modules ] )
+"""
+
+#==================================================\\Measurement//===================================================
+
+def mesurer( module ) :
+    racine = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+    env = dict( os.environ , PYTHONPATH = racine + os.pathsep + os.environ.get( 'PYTHONPATH' , '' ) )
+    code = MESURE.format( module = module , interdits = INTERDITS )
+    temps = [ ]
+    charges = set( )
+    for i in range(0,REPETITIONS):
+        sortie = subprocess.run( [ sys.executable , '-c' , code ] , env = env , capture_output = True ,
+                                 text = True , check = True ).stdout.split()
+        temps.append( float( sortie[ 0 ] ) )
+        charges.update( sortie[ 1: ] )
+    return min( temps ) , sorted( charges )
+
+def main( ) :
+    echec = False
+    for module , budget in BUDGET.items() :
+        t , charges = mesurer( module )
+        ok = t <= budget and not charges
+        echec = echec or not ok
+        print( "%-40s %7.1f ms  (budget %d ms)%s%s" % ( module , t , budget ,
+               "  charge : " + ", ".join( charges ) if charges else "" , "" if ok else "  ECHEC" ) )
+    return 1 if echec else 0
+
+if __name__ == '__main__' :
+    sys.exit( main( ) )
+
+#====================================================================================================================